@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import re
 import sys
 from pathlib import Path
 
+#: Start of the top-level ``version`` line in both manifests.
+_VERSION_LINE_PREFIX = 'version = "'
+
 
 def main(version: str) -> int:
     """Update version strings in manifest files.
@@ -16,26 +18,43 @@ def main(version: str) -> int:
 
     It sets the `version` field in both files to the provided version.
     """
-    if not re.fullmatch(r"\d+\.\d+\.\d+", version):
+    if not _is_semver(version):
         sys.stderr.write(f"Invalid version '{version}'; expected MAJOR.MINOR.PATCH.\n")
         return 1
 
-    targets = [
-        ("loxodrome-rs/Cargo.toml", r'(?m)^version = "(.*?)"'),
-        ("loxodrome/pyproject.toml", r'(?m)^version = "(.*?)"'),
-    ]
+    targets = ["loxodrome-rs/Cargo.toml", "loxodrome/pyproject.toml"]
 
-    for path, pattern in targets:
-        text = Path(path).read_text()
-        new_text, count = re.subn(pattern, f'version = "{version}"', text, count=1)
+    for path in targets:
+        text = Path(path).read_bytes().decode("utf-8")
+        new_text, count = _replace_version_line(text, version)
         if count != 1:
             sys.stderr.write(f"Could not update version in {path}; pattern not found.\n")
             return 1
-        Path(path).write_text(new_text)
+        Path(path).write_bytes(new_text.encode("utf-8"))
 
     return 0
 
 
+def _is_semver(version: str) -> bool:
+    """Return whether `version` is three dot-separated runs of decimal digits."""
+    parts = version.split(".")
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+
+def _replace_version_line(text: str, version: str) -> tuple[str, int]:
+    """Swap the first top-level `version = "..."` value, returning the new text and replacement count."""
+    lines = text.splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        if not line.startswith(_VERSION_LINE_PREFIX):
+            continue
+        closing_quote = line.find('"', len(_VERSION_LINE_PREFIX))
+        if closing_quote == -1:
+            break
+        lines[index] = f"{_VERSION_LINE_PREFIX}{version}{line[closing_quote:]}"
+        return "".join(lines), 1
+    return text, 0
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         sys.stderr.write("Usage: python .github/scripts/bump_version.py MAJOR.MINOR.PATCH\n")
@@ -6,8 +6,6 @@ import os
 import sys
 from pathlib import Path
 
-import tomllib
-
 
 def discover_repo_root() -> Path:
     workspace = os.environ.get("GITHUB_WORKSPACE")
@@ -22,6 +20,9 @@ def main() -> int:
         sys.stderr.write("RELEASE_VERSION must be set.\n")
         return 1
 
+    # Deferred so a missing RELEASE_VERSION fails before paying for the parser import.
+    import tomllib
+
     repo_root = discover_repo_root()
     manifest_cargo = repo_root / "loxodrome-rs" / "Cargo.toml"
     manifest_py = repo_root / "loxodrome" / "pyproject.toml"
@@ -33,8 +34,10 @@ def main() -> int:
         sys.stderr.write(f"Missing Python manifest: {manifest_py}\n")
         return 1
 
-    cargo_version = tomllib.loads(manifest_cargo.read_text())["package"]["version"]
-    py_version = tomllib.loads(manifest_py.read_text())["project"]["version"]
+    with manifest_cargo.open("rb") as handle:
+        cargo_version = tomllib.load(handle)["package"]["version"]
+    with manifest_py.open("rb") as handle:
+        py_version = tomllib.load(handle)["project"]["version"]
 
     errors: list[str] = []
     if cargo_version != release_version:
@@ -9,12 +9,9 @@ Behaviors:
 from __future__ import annotations
 
 import os
-import re
 import sys
 from pathlib import Path
 
-import tomllib
-
 
 def repo_root() -> Path:
     workspace = os.environ.get("GITHUB_WORKSPACE")
@@ -24,13 +21,18 @@ def repo_root() -> Path:
 
 
 def version_from_manifest(root: Path) -> str:
+    # Deferred so the tag path, which never reads a manifest, skips the parser import.
+    import tomllib
+
     manifest = root / "loxodrome" / "pyproject.toml"
-    data = tomllib.loads(manifest.read_text())
+    with manifest.open("rb") as handle:
+        data = tomllib.load(handle)
     return data["project"]["version"]
 
 
 def version_from_tag(tag: str) -> str:
-    if not re.fullmatch(r"v\d+\.\d+\.\d+", tag):
+    parts = tag[1:].split(".")
+    if not tag.startswith("v") or len(parts) != 3 or not all(part.isdecimal() for part in parts):
         raise ValueError(f"Release tags must look like vMAJOR.MINOR.PATCH (got {tag}).")
     return tag[1:]
 
@@ -5,8 +5,14 @@ Intended for GitHub Actions so stale binaries do not get folded into wheels.
 
 from __future__ import annotations
 
+import os
 import pathlib
 
+#: Filename prefix shared by every build of the compiled ``_loxodrome_rs`` extension.
+_EXTENSION_PREFIX = "_loxodrome_rs."
+#: Lower-cased file extensions that mark a compiled extension artifact on any platform.
+_EXTENSION_SUFFIXES = frozenset({"so", "pyd", "dylib", "dll"})
+
 
 def main() -> int:
     repo_root = pathlib.Path(__file__).resolve().parents[2]
@@ -17,13 +23,16 @@ def main() -> int:
         return 0
 
     removed: list[str] = []
-    for path in target_dir.glob("_loxodrome_rs.*"):
-        if path.suffix.lower() in {".so", ".pyd", ".dylib", ".dll"}:
-            path.unlink()
-            removed.append(path.name)
+    with os.scandir(target_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(_EXTENSION_PREFIX) and name.rpartition(".")[2].lower() in _EXTENSION_SUFFIXES:
+                os.unlink(entry.path)
+                removed.append(name)
 
     if removed:
-        print("Removed stale artifacts:", ", ".join(sorted(removed)))
+        removed.sort()
+        print("Removed stale artifacts:", ", ".join(removed))
     else:
         print("No stale compiled extensions found.")
 
@@ -10,19 +10,37 @@ import numpy as np
 from loxodrome import ops, vectorized as vz
 from loxodrome.geometry import Point
 
+#: Pairs of work per timed batch; smaller workloads repeat the call so each clock pair spans enough work.
+_PAIRS_PER_TIMED_BATCH = 100_000
 
-def _time_call(fn, *, repeat: int) -> float:
-    best = float("inf")
+
+def _time_call(fn, *, repeat: int, inner: int = 1) -> float:
+    """Return the best per-call wall time in seconds across ``repeat`` batches of ``inner`` calls.
+
+    Raise ``inner`` for sub-millisecond workloads so the two clock reads are amortized over enough work.
+    """
+    best_ns = 1 << 62
     for _ in range(repeat):
-        start = time.perf_counter()
-        fn()
-        best = min(best, time.perf_counter() - start)
-    return best
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            fn()
+        elapsed_ns = time.perf_counter_ns() - start
+        if elapsed_ns < best_ns:
+            best_ns = elapsed_ns
+    return best_ns / inner / 1e9
+
+
+def _inner_for(pairs: int) -> int:
+    """Number of calls per timed batch for a workload of ``pairs`` point pairs."""
+    return max(1, _PAIRS_PER_TIMED_BATCH // max(pairs, 1))
 
 
 def benchmark_pairwise(count: int, repeat: int) -> None:
-    origins = np.column_stack((np.linspace(0.0, 45.0, count), np.linspace(0.0, 90.0, count)))
-    destinations = np.column_stack((np.linspace(1.0, 46.0, count), np.linspace(1.0, 91.0, count)))
+    t = np.linspace(0.0, 1.0, count, dtype=np.float64)
+    origins = np.empty((count, 2), dtype=np.float64)
+    np.multiply(t, 45.0, out=origins[:, 0])
+    np.multiply(t, 90.0, out=origins[:, 1])
+    destinations = origins + 1.0
 
     origin_batch = vz.points_from_coords(origins)
     destination_batch = vz.points_from_coords(destinations)
@@ -33,17 +51,31 @@ def benchmark_pairwise(count: int, repeat: int) -> None:
     vectorized_best = _time_call(
         lambda: vz.geodesic_distance_batch(origin_batch, destination_batch),
         repeat=repeat,
+        inner=_inner_for(count),
     )
 
     scalar_sample = min(count, 5_000)
-    scalar_pairs = [
-        (Point(float(lat1), float(lon1)), Point(float(lat2), float(lon2)))
-        for (lat1, lon1), (lat2, lon2) in zip(origins[:scalar_sample], destinations[:scalar_sample])
-    ]
-    scalar_best = _time_call(lambda: [ops.geodesic_distance(a, b) for a, b in scalar_pairs], repeat=repeat)
+    # Build the points once, outside the timer, as parallel lists so the timed loop only measures the kernel calls.
+    scalar_origins = [Point(lat, lon) for lat, lon in origins[:scalar_sample].tolist()]
+    scalar_destinations = [Point(lat, lon) for lat, lon in destinations[:scalar_sample].tolist()]
+    scalar_best = _time_call(
+        lambda: list(map(ops.geodesic_distance, scalar_origins, scalar_destinations)),
+        repeat=repeat,
+        inner=_inner_for(scalar_sample),
+    )
+
+    # Same sample as the scalar loop but through one batched FFI call, isolating per-call crossing overhead.
+    sample_origins = vz.points_from_coords(origins[:scalar_sample])
+    sample_destinations = vz.points_from_coords(destinations[:scalar_sample])
+    batched_sample_best = _time_call(
+        lambda: vz.geodesic_distance_batch(sample_origins, sample_destinations),
+        repeat=repeat,
+        inner=_inner_for(scalar_sample),
+    )
 
     print(f"Vectorized distance ({count} pairs): {vectorized_best * 1e3:.2f} ms")
     print(f"Scalar distance ({scalar_sample} pairs): {scalar_best * 1e3:.2f} ms")
+    print(f"FFI-batched scalar sample ({scalar_sample} pairs): {batched_sample_best * 1e3:.2f} ms")
 
 
 def main() -> None:
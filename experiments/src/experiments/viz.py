@@ -5,17 +5,19 @@ from __future__ import annotations
 import argparse
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Sequence
 
 import matplotlib.pyplot as plt
 import numpy as np
+import orjson
+from matplotlib.collections import LineCollection
 from matplotlib.colors import LinearSegmentedColormap
 from pydantic import BaseModel, ConfigDict, model_validator
 
-from loxodrome import ops
+from loxodrome import vectorized as vz
 from loxodrome.geometry import Point
 
-__all__ = ["RouteResult", "load_routes", "render_routes", "render_routes_figure", "main"]
+__all__ = ["RouteResult", "load_routes", "render_routes", "render_routes_figure", "render_routes_many", "main"]
 
 
 @dataclass(frozen=True)
@@ -59,26 +61,51 @@ class _RouteCollection(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-def load_routes(source: str | Path) -> list[RouteResult]:
+def load_routes(source: str | Path, *, validate: bool = False) -> list[RouteResult]:
     """Load route results from a JSON file.
 
     The file should contain a top-level object with a ``routes`` array. Each route
     entry must define ``origin`` and ``destination`` coordinates, provided either as
     ``[lat, lon]`` lists or ``{"lat": ..., "lon": ...}`` mappings. ``distance_km`` is
-    optional; missing values are computed with ``loxodrome.ops.geodesic_distance``.
+    optional; missing values are computed in a single
+    ``loxodrome.vectorized.geodesic_distance_batch`` call.
+
+    By default the file is decoded with ``orjson`` and entries are read directly. Pass
+    ``validate=True`` to run the Pydantic schema first for descriptive errors on
+    malformed input (the CLI does this).
     """
-    raw_text = Path(source).read_text()
-    parsed = _RouteCollection.model_validate_json(raw_text)
+    raw_bytes = Path(source).read_bytes()
+    if validate:
+        parsed = _RouteCollection.model_validate_json(raw_bytes)
+        entries = [
+            (
+                entry.origin.lat,
+                entry.origin.lon,
+                entry.destination.lat,
+                entry.destination.lon,
+                entry.label,
+                entry.distance_km,
+            )
+            for entry in parsed.routes
+        ]
+    else:
+        entries = [_route_fields(entry) for entry in orjson.loads(raw_bytes)["routes"]]
+
+    origins = [Point(entry[0], entry[1]) for entry in entries]
+    destinations = [Point(entry[2], entry[3]) for entry in entries]
+    distances_km = [entry[5] for entry in entries]
 
-    routes: list[RouteResult] = []
-    for entry in parsed.routes:
-        origin = Point(entry.origin.lat, entry.origin.lon)
-        destination = Point(entry.destination.lat, entry.destination.lon)
-        distance_km = entry.distance_km
-        if distance_km is None:
-            distance_km = ops.geodesic_distance(origin, destination) / 1000.0
-        routes.append(RouteResult(origin=origin, destination=destination, distance_km=distance_km, label=entry.label))
-    return routes
+    missing = [index for index, distance_km in enumerate(distances_km) if distance_km is None]
+    if missing:
+        coords = np.array([entries[index][:4] for index in missing], dtype=np.float64)
+        computed_m = vz.geodesic_distance_batch(coords[:, :2], coords[:, 2:]).to_numpy()
+        for index, meters in zip(missing, computed_m.tolist()):
+            distances_km[index] = meters / 1000.0
+
+    return [
+        RouteResult(origin=origin, destination=destination, distance_km=float(distance_km), label=entry[4])
+        for origin, destination, distance_km, entry in zip(origins, destinations, distances_km, entries)
+    ]
 
 
 def render_routes(
@@ -116,69 +143,40 @@ def render_routes_figure(
     """Create a matplotlib figure for the given routes without writing to disk."""
     if not routes:
         raise ValueError("At least one route is required to render a visualization")
-    style = _THEMES.get(theme)
-    if style is None:
-        raise ValueError(f"Unknown theme '{theme}'. Available themes: {', '.join(sorted(_THEMES))}")
-
-    lats, lons = _collect_extents(routes)
-    lat_padding = (max(lats) - min(lats)) * 0.1 or 5.0
-    lon_padding = (max(lons) - min(lons)) * 0.1 or 5.0
-    lat_min, lat_max = min(lats) - lat_padding, max(lats) + lat_padding
-    lon_min, lon_max = min(lons) - lon_padding, max(lons) + lon_padding
-
-    fig, ax = plt.subplots(figsize=(8, 5), dpi=dpi, layout="constrained", facecolor=style["background"])
-    ax.set_facecolor(style["background"])
-    _apply_gradient(ax, lon_min, lon_max, lat_min, lat_max, style)
 
-    for route in routes:
-        lat_points = (route.origin.lat, route.destination.lat)
-        lon_points = (route.origin.lon, route.destination.lon)
-        ax.plot(
-            lon_points,
-            lat_points,
-            color=style["line"],
-            linewidth=2.5,
-            alpha=0.85,
-            solid_capstyle="round",
-        )
-        ax.scatter(
-            lon_points,
-            lat_points,
-            s=70,
-            zorder=3,
-            linewidth=0,
-            c=(style["point_origin"], style["point_destination"]),
-        )
+    style = _resolve_theme(theme)
+    fig, ax = plt.subplots(figsize=(8, 5), dpi=dpi, layout="constrained", facecolor=style.background)
+    _draw_routes(ax, routes, title=title, style=style, show_labels=show_labels)
+    return fig
 
-        if show_labels:
-            midpoint_lat = sum(lat_points) / 2
-            midpoint_lon = sum(lon_points) / 2
-            label = route.label or f"{route.distance_km:.1f} km"
-            ax.text(
-                midpoint_lon,
-                midpoint_lat,
-                label,
-                color=style["text"],
-                fontsize=10,
-                fontweight="semibold",
-                ha="center",
-                va="center",
-                bbox=dict(
-                    boxstyle="round,pad=0.25",
-                    facecolor=style["label_bg"],
-                    edgecolor="none",
-                    alpha=0.65,
-                ),
-            )
 
-    ax.set_xlim(lon_min, lon_max)
-    ax.set_ylim(lat_min, lat_max)
-    ax.set_xlabel("Longitude (deg)", color=style["text"])
-    ax.set_ylabel("Latitude (deg)", color=style["text"])
-    ax.set_title(title, color=style["text"], fontsize=14, fontweight="bold")
-    _stylize_axes(ax, style)
+def render_routes_many(
+    jobs: Iterable[tuple[Sequence[RouteResult], str | Path]],
+    *,
+    title: str = "Loxodrome routes",
+    dpi: int = 240,
+    theme: str = "dusk",
+    show_labels: bool = True,
+) -> list[Path]:
+    """Render several ``(routes, output)`` jobs to PNGs, reusing one figure between them.
 
-    return fig
+    Building a matplotlib figure dominates the cost of small renders, so bulk callers
+    should prefer this over calling :func:`render_routes` in a loop.
+    """
+    style = _resolve_theme(theme)
+    fig, ax = plt.subplots(figsize=(8, 5), dpi=dpi, layout="constrained", facecolor=style.background)
+    written: list[Path] = []
+    try:
+        for routes, output in jobs:
+            ax.clear()
+            _draw_routes(ax, routes, title=title, style=style, show_labels=show_labels)
+            output_path = Path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            fig.savefig(output_path, dpi=dpi, facecolor=fig.get_facecolor())
+            written.append(output_path)
+    finally:
+        plt.close(fig)
+    return written
 
 
 def main(argv: Sequence[str] | None = None) -> None:
@@ -206,7 +204,7 @@ def main(argv: Sequence[str] | None = None) -> None:
     )
     args = parser.parse_args(argv)
 
-    routes = load_routes(args.input)
+    routes = load_routes(args.input, validate=True)
     output_path = render_routes(
         routes,
         output=args.output,
@@ -218,21 +216,128 @@ def main(argv: Sequence[str] | None = None) -> None:
     print(f"Wrote visualization to {output_path.resolve()}")
 
 
-def _collect_extents(routes: Iterable[RouteResult]) -> tuple[list[float], list[float]]:
-    latitudes: list[float] = []
-    longitudes: list[float] = []
-    for route in routes:
-        latitudes.extend((route.origin.lat, route.destination.lat))
-        longitudes.extend((route.origin.lon, route.destination.lon))
-    return latitudes, longitudes
+def _resolve_theme(theme: str) -> _Theme:
+    style = _THEMES.get(theme)
+    if style is None:
+        raise ValueError(f"Unknown theme '{theme}'. Available themes: {', '.join(sorted(_THEMES))}")
+    return style
+
+
+def _draw_routes(
+    ax: plt.Axes,
+    routes: Sequence[RouteResult],
+    *,
+    title: str,
+    style: _Theme,
+    show_labels: bool,
+) -> None:
+    if not routes:
+        raise ValueError("At least one route is required to render a visualization")
+
+    lat_low, lat_high, lon_low, lon_high = _collect_extents(routes)
+    lat_padding = (lat_high - lat_low) * 0.1 or 5.0
+    lon_padding = (lon_high - lon_low) * 0.1 or 5.0
+    lat_min, lat_max = lat_low - lat_padding, lat_high + lat_padding
+    lon_min, lon_max = lon_low - lon_padding, lon_high + lon_padding
+
+    ax.set_facecolor(style.background)
+    _apply_gradient(ax, lon_min, lon_max, lat_min, lat_max, style)
+
+    count = len(routes)
+    segments = np.empty((count, 2, 2), dtype=np.float64)
+    for index, route in enumerate(routes):
+        segments[index, 0] = (route.origin.lon, route.origin.lat)
+        segments[index, 1] = (route.destination.lon, route.destination.lat)
+
+    ax.add_collection(
+        LineCollection(
+            segments,
+            colors=style.line,
+            linewidths=2.5,
+            alpha=0.85,
+            capstyle="round",
+        )
+    )
+    endpoints = segments.transpose(1, 0, 2).reshape(-1, 2)
+    ax.scatter(
+        endpoints[:, 0],
+        endpoints[:, 1],
+        s=70,
+        zorder=3,
+        linewidth=0,
+        c=[style.point_origin] * count + [style.point_destination] * count,
+    )
+
+    if show_labels:
+        midpoints = segments.mean(axis=1)
+        text_color = style.text
+        label_bg = style.label_bg
+        for index, route in enumerate(routes):
+            label = route.label or f"{route.distance_km:.1f} km"
+            ax.text(
+                midpoints[index, 0],
+                midpoints[index, 1],
+                label,
+                color=text_color,
+                fontsize=10,
+                fontweight="semibold",
+                ha="center",
+                va="center",
+                bbox=dict(
+                    boxstyle="round,pad=0.25",
+                    facecolor=label_bg,
+                    edgecolor="none",
+                    alpha=0.65,
+                ),
+            )
+
+    ax.set_xlim(lon_min, lon_max)
+    ax.set_ylim(lat_min, lat_max)
+    ax.set_xlabel("Longitude (deg)", color=style.text)
+    ax.set_ylabel("Latitude (deg)", color=style.text)
+    ax.set_title(title, color=style.text, fontsize=14, fontweight="bold")
+    _stylize_axes(ax, style)
+
+
+def _route_fields(entry: dict[str, Any]) -> tuple[float, float, float, float, str | None, float | None]:
+    origin_lat, origin_lon = _coordinate_fields(entry["origin"])
+    destination_lat, destination_lon = _coordinate_fields(entry["destination"])
+    label = entry.get("label")
+    distance_km = entry.get("distance_km")
+    return (
+        origin_lat,
+        origin_lon,
+        destination_lat,
+        destination_lon,
+        None if label is None else str(label),
+        None if distance_km is None else float(distance_km),
+    )
+
+
+def _coordinate_fields(value: Any) -> tuple[float, float]:
+    if isinstance(value, dict):
+        return float(value["lat"]), float(value["lon"])
+    lat, lon = value
+    return float(lat), float(lon)
+
+
+def _collect_extents(routes: Sequence[RouteResult]) -> tuple[float, float, float, float]:
+    """Return ``(lat_min, lat_max, lon_min, lon_max)`` across every route endpoint."""
+    count = len(routes)
+    latitudes = np.empty(2 * count, dtype=np.float64)
+    longitudes = np.empty(2 * count, dtype=np.float64)
+    for index, route in enumerate(routes):
+        latitudes[2 * index] = route.origin.lat
+        latitudes[2 * index + 1] = route.destination.lat
+        longitudes[2 * index] = route.origin.lon
+        longitudes[2 * index + 1] = route.destination.lon
+    return float(latitudes.min()), float(latitudes.max()), float(longitudes.min()), float(longitudes.max())
 
 
-def _apply_gradient(ax: plt.Axes, lon_min: float, lon_max: float, lat_min: float, lat_max: float, style: dict[str, str]) -> None:
-    gradient = np.linspace(0, 1, 256)
-    gradient = np.vstack((gradient, gradient))
-    cmap = LinearSegmentedColormap.from_list("loxodrome-viz-bg", [style["gradient_bottom"], style["gradient_top"]])
+def _apply_gradient(ax: plt.Axes, lon_min: float, lon_max: float, lat_min: float, lat_max: float, style: _Theme) -> None:
+    cmap = LinearSegmentedColormap.from_list("loxodrome-viz-bg", [style.gradient_bottom, style.gradient_top])
     ax.imshow(
-        gradient,
+        _GRADIENT,
         extent=[lon_min, lon_max, lat_min, lat_max],
         origin="lower",
         cmap=cmap,
@@ -242,39 +347,56 @@ def _apply_gradient(ax: plt.Axes, lon_min: float, lon_max: float, lat_min: float
     )
 
 
-def _stylize_axes(ax: plt.Axes, style: dict[str, str]) -> None:
+def _stylize_axes(ax: plt.Axes, style: _Theme) -> None:
     for spine in ax.spines.values():
-        spine.set_color(style["accent"])
+        spine.set_color(style.accent)
         spine.set_linewidth(1.0)
-    ax.tick_params(colors=style["text"], labelsize=10)
-    ax.grid(color=style["grid"], linewidth=0.6, alpha=0.4)
-
-
-_THEMES: dict[str, dict[str, str]] = {
-    "dusk": {
-        "background": "#0b0c10",
-        "gradient_bottom": "#111827",
-        "gradient_top": "#1f2937",
-        "line": "#60a5fa",
-        "point_origin": "#f59e0b",
-        "point_destination": "#34d399",
-        "text": "#e5e7eb",
-        "grid": "#9ca3af",
-        "label_bg": "#1f2937",
-        "accent": "#374151",
-    },
-    "paper": {
-        "background": "#f7f7f2",
-        "gradient_bottom": "#f0efeb",
-        "gradient_top": "#dcd7c9",
-        "line": "#6b705c",
-        "point_origin": "#cb997e",
-        "point_destination": "#386641",
-        "text": "#1f2933",
-        "grid": "#b7b7a4",
-        "label_bg": "#fffefb",
-        "accent": "#8a817c",
-    },
+    ax.tick_params(colors=style.text, labelsize=10)
+    ax.grid(color=style.grid, linewidth=0.6, alpha=0.4)
+
+
+@dataclass(frozen=True, slots=True)
+class _Theme:
+    background: str
+    gradient_bottom: str
+    gradient_top: str
+    line: str
+    point_origin: str
+    point_destination: str
+    text: str
+    grid: str
+    label_bg: str
+    accent: str
+
+
+#: Background ramp shared by every render; ``imshow`` never mutates it.
+_GRADIENT = np.vstack((np.linspace(0.0, 1.0, 256),) * 2)
+
+_THEMES: dict[str, _Theme] = {
+    "dusk": _Theme(
+        background="#0b0c10",
+        gradient_bottom="#111827",
+        gradient_top="#1f2937",
+        line="#60a5fa",
+        point_origin="#f59e0b",
+        point_destination="#34d399",
+        text="#e5e7eb",
+        grid="#9ca3af",
+        label_bg="#1f2937",
+        accent="#374151",
+    ),
+    "paper": _Theme(
+        background="#f7f7f2",
+        gradient_bottom="#f0efeb",
+        gradient_top="#dcd7c9",
+        line="#6b705c",
+        point_origin="#cb997e",
+        point_destination="#386641",
+        text="#1f2933",
+        grid="#b7b7a4",
+        label_bg="#fffefb",
+        accent="#8a817c",
+    ),
 }
 
 
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pytest
+
+from experiments.viz import render_routes, render_routes_figure
+
+
+def test_render_routes_figure_rejects_empty_routes_without_leaking_figure() -> None:
+    plt.close("all")
+
+    with pytest.raises(ValueError, match="At least one route"):
+        render_routes_figure([])
+
+    assert plt.get_fignums() == []
+
+
+def test_render_routes_rejects_empty_routes_without_leaking_figure(tmp_path: Path) -> None:
+    plt.close("all")
+
+    with pytest.raises(ValueError, match="At least one route"):
+        render_routes([], output=tmp_path / "routes.png")
+
+    assert plt.get_fignums() == []
+    assert not (tmp_path / "routes.png").exists()
@@ -1,4 +1,5 @@
 use std::fmt;
+use std::sync::{Arc, LazyLock};
 
 use geographiclib_rs::{Geodesic as GeographicGeodesic, InverseGeodesic};
 
@@ -10,7 +11,22 @@ use crate::{Distance, Ellipsoid, GeodistError, Point};
 /// This adapter keeps the public trait surface small while delegating the
 /// heavy lifting to Karney's formulation provided by the external crate.
 pub struct Geographiclib {
-  geodesic: GeographicGeodesic,
+  geodesic: Arc<GeographicGeodesic>,
+}
+
+/// Shared WGS84 solver.
+///
+/// `GeographicGeodesic::new` expands Karney's series coefficients for the
+/// flattening on every call; WGS84 is by far the most common model, so its
+/// coefficients are built once and reused by every solver on that ellipsoid.
+static WGS84_GEODESIC: LazyLock<Arc<GeographicGeodesic>> = LazyLock::new(|| {
+  let ellipsoid = Ellipsoid::wgs84();
+  Arc::new(build_geodesic(ellipsoid))
+});
+
+fn build_geodesic(ellipsoid: Ellipsoid) -> GeographicGeodesic {
+  let flattening = 1.0 - (ellipsoid.semi_minor_axis_m / ellipsoid.semi_major_axis_m);
+  GeographicGeodesic::new(ellipsoid.semi_major_axis_m, flattening)
 }
 
 impl Geographiclib {
@@ -22,8 +38,11 @@ impl Geographiclib {
   /// positive, and ordered (semi-major >= semi-minor).
   pub fn from_ellipsoid(ellipsoid: Ellipsoid) -> Result<Self, GeodistError> {
     ellipsoid.validate()?;
-    let flattening = 1.0 - (ellipsoid.semi_minor_axis_m / ellipsoid.semi_major_axis_m);
-    let geodesic = GeographicGeodesic::new(ellipsoid.semi_major_axis_m, flattening);
+    let geodesic = if ellipsoid == Ellipsoid::wgs84() {
+      Arc::clone(&WGS84_GEODESIC)
+    } else {
+      Arc::new(build_geodesic(ellipsoid))
+    };
 
     Ok(Self { geodesic })
   }
@@ -84,3 +103,21 @@ fn normalize_bearing(mut degrees: f64) -> f64 {
   }
   degrees
 }
+
+#[cfg(test)]
+mod tests {
+  use super::*;
+
+  #[test]
+  fn wgs84_solver_is_shared_and_matches_fresh_construction() {
+    let first = Geographiclib::from_ellipsoid(Ellipsoid::wgs84()).unwrap();
+    let second = Geographiclib::from_ellipsoid(Ellipsoid::wgs84()).unwrap();
+    assert!(Arc::ptr_eq(&first.geodesic, &second.geodesic));
+
+    let fresh = build_geodesic(Ellipsoid::wgs84());
+    let origin = Point::new(40.0, -73.0).unwrap();
+    let destination = Point::new(51.5, -0.1).unwrap();
+    let expected: f64 = fresh.inverse(origin.lat, origin.lon, destination.lat, destination.lon);
+    assert_eq!(first.distance_m(origin, destination).unwrap(), expected);
+  }
+}
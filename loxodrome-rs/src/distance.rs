@@ -271,10 +271,19 @@ fn geodesic_with_bearings_inner(radius_meters: f64, p1: Point, p2: Point) -> Res
   })
 }
 
-/// Compute the forward azimuth from one latitude to another in degrees.
-pub fn initial_bearing_from_radians(lat1: f64, lat2: f64, delta_lon: f64) -> f64 {
-  let y = delta_lon.sin() * lat2.cos();
-  let x = lat1.cos() * lat2.sin() - lat1.sin() * lat2.cos() * delta_lon.cos();
+/// Compute the forward azimuth in degrees from precomputed sines/cosines of
+/// both latitudes and of the longitude delta.
+#[inline]
+fn azimuth_from_trig(
+  sin_lat1: f64,
+  cos_lat1: f64,
+  sin_lat2: f64,
+  cos_lat2: f64,
+  sin_delta_lon: f64,
+  cos_delta_lon: f64,
+) -> f64 {
+  let y = sin_delta_lon * cos_lat2;
+  let x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_delta_lon;
   normalize_bearing(y.atan2(x).to_degrees())
 }
 
@@ -304,21 +313,20 @@ pub fn spherical_distance_and_bearings_with_radius(
   let delta_lat = (lat2_deg - lat1_deg).to_radians();
   let delta_lon = (lon2_deg - lon1_deg).to_radians();
 
-  let sin_lat = (delta_lat / 2.0).sin();
-  let sin_lon = (delta_lon / 2.0).sin();
-
-  let a = sin_lat * sin_lat + lat1_rad.cos() * lat2_rad.cos() * sin_lon * sin_lon;
-  let normalized_a = a.clamp(0.0, 1.0);
-  let c = 2.0 * normalized_a.sqrt().atan2((1.0 - normalized_a).sqrt());
+  let (sin_lat1, cos_lat1) = lat1_rad.sin_cos();
+  let (sin_lat2, cos_lat2) = lat2_rad.sin_cos();
 
-  let meters = radius_meters * c;
+  let meters = radius_meters * haversine_central_angle(cos_lat1, cos_lat2, delta_lat, delta_lon);
 
   if meters == 0.0 {
     return (0.0, 0.0, 0.0);
   }
 
-  let initial = initial_bearing_from_radians(lat1_rad, lat2_rad, delta_lon);
-  let reverse = initial_bearing_from_radians(lat2_rad, lat1_rad, -delta_lon);
+  // The reverse azimuth is the forward formula with the endpoints swapped and
+  // the longitude delta negated, so both reuse the same trig values.
+  let (sin_delta_lon, cos_delta_lon) = delta_lon.sin_cos();
+  let initial = azimuth_from_trig(sin_lat1, cos_lat1, sin_lat2, cos_lat2, sin_delta_lon, cos_delta_lon);
+  let reverse = azimuth_from_trig(sin_lat2, cos_lat2, sin_lat1, cos_lat1, -sin_delta_lon, cos_delta_lon);
   let final_bearing = normalize_bearing(reverse + 180.0);
 
   (meters, initial, final_bearing)
@@ -330,6 +338,104 @@ pub fn spherical_distance_and_bearings(lat1_deg: f64, lon1_deg: f64, lat2_deg: f
   spherical_distance_and_bearings_with_radius(EARTH_RADIUS_METERS, lat1_deg, lon1_deg, lat2_deg, lon2_deg)
 }
 
+/// Compute the spherical distance in meters using the provided radius.
+///
+/// Matches the distance returned by
+/// [`spherical_distance_and_bearings_with_radius`] without evaluating either
+/// bearing, which saves two `atan2` calls and their trig per pair in
+/// distance-only batch loops. Inputs are degrees with no validation.
+pub fn spherical_distance_with_radius(
+  radius_meters: f64,
+  lat1_deg: f64,
+  lon1_deg: f64,
+  lat2_deg: f64,
+  lon2_deg: f64,
+) -> f64 {
+  let cos_lat1 = lat1_deg.to_radians().cos();
+  let cos_lat2 = lat2_deg.to_radians().cos();
+  let delta_lat = (lat2_deg - lat1_deg).to_radians();
+  let delta_lon = (lon2_deg - lon1_deg).to_radians();
+
+  radius_meters * haversine_central_angle(cos_lat1, cos_lat2, delta_lat, delta_lon)
+}
+
+/// Compute spherical distance using the WGS84 mean radius.
+#[cfg_attr(not(feature = "python"), allow(dead_code))]
+pub fn spherical_distance(lat1_deg: f64, lon1_deg: f64, lat2_deg: f64, lon2_deg: f64) -> f64 {
+  spherical_distance_with_radius(EARTH_RADIUS_METERS, lat1_deg, lon1_deg, lat2_deg, lon2_deg)
+}
+
+/// Compute spherical distances in meters from one origin to many
+/// destinations using the provided radius.
+///
+/// The origin's latitude cosine is evaluated once rather than per pair.
+/// Destination slices must share a length. Inputs are degrees with no
+/// validation.
+#[cfg_attr(not(feature = "python"), allow(dead_code))]
+pub fn spherical_distances_from_with_radius(
+  radius_meters: f64,
+  origin_lat_deg: f64,
+  origin_lon_deg: f64,
+  lat_deg: &[f64],
+  lon_deg: &[f64],
+) -> Vec<f64> {
+  debug_assert_eq!(lat_deg.len(), lon_deg.len());
+  let cos_origin_lat = origin_lat_deg.to_radians().cos();
+
+  lat_deg
+    .iter()
+    .zip(lon_deg)
+    .map(|(&lat, &lon)| {
+      let delta_lat = (lat - origin_lat_deg).to_radians();
+      let delta_lon = (lon - origin_lon_deg).to_radians();
+      radius_meters * haversine_central_angle(cos_origin_lat, lat.to_radians().cos(), delta_lat, delta_lon)
+    })
+    .collect()
+}
+
+/// Compute a row-major `a.len() x b.len()` matrix of spherical distances in
+/// meters using the provided radius.
+///
+/// Latitude cosines are evaluated once per point rather than once per pair.
+/// Slices within each set must share a length. Inputs are degrees with no
+/// validation.
+#[cfg_attr(not(feature = "python"), allow(dead_code))]
+pub fn spherical_distance_matrix_with_radius(
+  radius_meters: f64,
+  a_lat_deg: &[f64],
+  a_lon_deg: &[f64],
+  b_lat_deg: &[f64],
+  b_lon_deg: &[f64],
+) -> Vec<f64> {
+  debug_assert_eq!(a_lat_deg.len(), a_lon_deg.len());
+  debug_assert_eq!(b_lat_deg.len(), b_lon_deg.len());
+  let cos_b_lat: Vec<f64> = b_lat_deg.iter().map(|lat| lat.to_radians().cos()).collect();
+  let mut out = Vec::with_capacity(a_lat_deg.len() * b_lat_deg.len());
+
+  for (&origin_lat, &origin_lon) in a_lat_deg.iter().zip(a_lon_deg) {
+    let cos_origin_lat = origin_lat.to_radians().cos();
+    for ((&lat, &lon), &cos_lat) in b_lat_deg.iter().zip(b_lon_deg).zip(&cos_b_lat) {
+      let delta_lat = (lat - origin_lat).to_radians();
+      let delta_lon = (lon - origin_lon).to_radians();
+      out.push(radius_meters * haversine_central_angle(cos_origin_lat, cos_lat, delta_lat, delta_lon));
+    }
+  }
+
+  out
+}
+
+/// Central angle in radians between two points given their latitude cosines
+/// and latitude/longitude deltas in radians (haversine formulation).
+#[inline]
+fn haversine_central_angle(cos_lat1: f64, cos_lat2: f64, delta_lat: f64, delta_lon: f64) -> f64 {
+  let sin_lat = (delta_lat / 2.0).sin();
+  let sin_lon = (delta_lon / 2.0).sin();
+
+  let a = sin_lat * sin_lat + cos_lat1 * cos_lat2 * sin_lon * sin_lon;
+  let normalized_a = a.clamp(0.0, 1.0);
+  2.0 * normalized_a.sqrt().atan2((1.0 - normalized_a).sqrt())
+}
+
 /// Convert a geodetic point to its ECEF Cartesian representation.
 ///
 /// Inputs are degrees for latitude/longitude and meters for altitude. The
@@ -397,6 +503,52 @@ mod tests {
     assert!((meters - expected).abs() < 1e-6);
   }
 
+  #[test]
+  fn spherical_distance_matches_distance_and_bearings() {
+    let cases = [
+      (0.0, 0.0, 0.0, 1.0),
+      (40.7128, -74.0060, 51.5074, -0.1278),
+      (90.0, 0.0, -90.0, 0.0),
+      (10.0, 20.0, 10.0, 20.0),
+    ];
+
+    for (lat1, lon1, lat2, lon2) in cases {
+      let (expected, _, _) = spherical_distance_and_bearings(lat1, lon1, lat2, lon2);
+      assert_eq!(spherical_distance(lat1, lon1, lat2, lon2), expected);
+    }
+  }
+
+  #[test]
+  fn distances_from_origin_match_pairwise() {
+    let lat = [0.0, 51.5074, -90.0, 10.0];
+    let lon = [1.0, -0.1278, 0.0, 20.0];
+
+    let results = spherical_distances_from_with_radius(EARTH_RADIUS_METERS, 10.0, 20.0, &lat, &lon);
+    assert_eq!(results.len(), lat.len());
+    for (idx, meters) in results.into_iter().enumerate() {
+      assert_eq!(meters, spherical_distance(10.0, 20.0, lat[idx], lon[idx]));
+    }
+  }
+
+  #[test]
+  fn distance_matrix_matches_pairwise() {
+    let a_lat = [10.0, -33.8688];
+    let a_lon = [20.0, 151.2093];
+    let b_lat = [0.0, 51.5074, -90.0];
+    let b_lon = [1.0, -0.1278, 0.0];
+
+    let results = spherical_distance_matrix_with_radius(EARTH_RADIUS_METERS, &a_lat, &a_lon, &b_lat, &b_lon);
+    assert_eq!(results.len(), a_lat.len() * b_lat.len());
+    for (row, (&lat1, &lon1)) in a_lat.iter().zip(&a_lon).enumerate() {
+      for (col, (&lat2, &lon2)) in b_lat.iter().zip(&b_lon).enumerate() {
+        assert_eq!(
+          results[row * b_lat.len() + col],
+          spherical_distance(lat1, lon1, lat2, lon2)
+        );
+      }
+    }
+  }
+
   #[test]
   fn identical_points_are_zero() {
     let point = Point::new(10.0, 20.0).unwrap();
@@ -843,6 +843,17 @@ fn hausdorff_directed_3d_from_ecef(
   HausdorffDirectedWitness::from_raw(raw)
 }
 
+/// Early-break test for the naive scans: once an origin has a candidate no
+/// farther than the running maximum, its nearest distance cannot exceed that
+/// maximum, so the remaining candidates need not be visited.
+///
+/// Ties keep the earlier witness (only strictly larger minima replace it), so
+/// breaking on equality leaves the reported witness unchanged.
+#[inline]
+fn cannot_raise_max(meters: f64, best: Option<DirectedHausdorffMeters>) -> bool {
+  best.is_some_and(|current| meters <= current.meters)
+}
+
 fn hausdorff_directed_naive<A: GeodesicAlgorithm>(
   algorithm: &A,
   origins: &[Positioned<Point>],
@@ -857,6 +868,9 @@ fn hausdorff_directed_naive<A: GeodesicAlgorithm>(
       if nearest.is_none_or(|(current, _)| meters < current) {
         nearest = Some((meters, candidate.index));
       }
+      if cannot_raise_max(meters, best) {
+        break;
+      }
     }
 
     let (min_distance, nearest_index) = nearest.expect("candidate set validated as non-empty");
@@ -932,6 +946,9 @@ fn hausdorff_directed_3d_naive(
       if nearest.is_none_or(|(current, _)| meters < current) {
         nearest = Some((meters, candidate.index));
       }
+      if cannot_raise_max(meters, best) {
+        break;
+      }
     }
 
     let (min_distance, nearest_index) = nearest.expect("candidate set validated as non-empty");
@@ -1083,6 +1100,35 @@ mod tests {
     assert_eq!(d.distance().meters(), 0.0);
   }
 
+  #[test]
+  fn naive_early_break_matches_exhaustive_scan() {
+    let a: Vec<Point> = (0..12)
+      .map(|i| Point::new(f64::from(i) * 0.7 - 4.0, f64::from(i % 5) * 1.3).unwrap())
+      .collect();
+    let b: Vec<Point> = (0..9)
+      .map(|i| Point::new(f64::from(i % 4) * 1.1, f64::from(i) * 0.6 - 2.0).unwrap())
+      .collect();
+
+    let raw = hausdorff_directed_naive(&Spherical::default(), &position_points(&a), &position_points(&b)).unwrap();
+
+    let mut expected: Option<(f64, usize, usize)> = None;
+    for (i, origin) in a.iter().enumerate() {
+      let (meters, j) = b
+        .iter()
+        .enumerate()
+        .map(|(j, candidate)| (geodesic_distance(*origin, *candidate).unwrap().meters(), j))
+        .fold((f64::INFINITY, 0), |acc, item| if item.0 < acc.0 { item } else { acc });
+      if expected.is_none_or(|(current, _, _)| meters > current) {
+        expected = Some((meters, i, j));
+      }
+    }
+
+    let (meters, origin_index, candidate_index) = expected.unwrap();
+    assert_eq!(raw.meters, meters);
+    assert_eq!(raw.origin_index, origin_index);
+    assert_eq!(raw.candidate_index, candidate_index);
+  }
+
   #[test]
   fn asymmetric_directed_distance() {
     let a = [Point::new(0.0, 0.0).unwrap(), Point::new(0.0, 2.0).unwrap()];
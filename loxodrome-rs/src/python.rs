@@ -18,7 +18,8 @@ use pyo3::{PyErr, create_exception, wrap_pyfunction};
 
 use crate::constants::{EARTH_RADIUS_METERS, MAX_LAT_DEGREES, MAX_LON_DEGREES, MIN_LAT_DEGREES, MIN_LON_DEGREES};
 use crate::{
-  chamfer as chamfer_kernel, distance, hausdorff as hausdorff_kernel, polygon as polygon_kernel, polyline, types,
+  GeodesicAlgorithm, Geographiclib, chamfer as chamfer_kernel, distance, hausdorff as hausdorff_kernel,
+  polygon as polygon_kernel, polyline, types,
 };
 
 type RingTuple = Vec<(f64, f64)>;
@@ -805,27 +806,28 @@ fn geodesic_distance_3d(p1: &Point3D, p2: &Point3D) -> PyResult<f64> {
 }
 
 #[pyfunction]
-fn hausdorff_directed(a: Vec<Point>, b: Vec<Point>) -> PyResult<HausdorffDirectedWitness> {
+fn hausdorff_directed(py: Python<'_>, a: Vec<Point>, b: Vec<Point>) -> PyResult<HausdorffDirectedWitness> {
   let points_a = map_to_points(&a)?;
   let points_b = map_to_points(&b)?;
 
-  hausdorff_kernel::hausdorff_directed(&points_a, &points_b)
+  py.detach(|| hausdorff_kernel::hausdorff_directed(&points_a, &points_b))
     .map(HausdorffDirectedWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff(a: Vec<Point>, b: Vec<Point>) -> PyResult<HausdorffWitness> {
+fn hausdorff(py: Python<'_>, a: Vec<Point>, b: Vec<Point>) -> PyResult<HausdorffWitness> {
   let points_a = map_to_points(&a)?;
   let points_b = map_to_points(&b)?;
 
-  hausdorff_kernel::hausdorff(&points_a, &points_b)
+  py.detach(|| hausdorff_kernel::hausdorff(&points_a, &points_b))
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
 fn hausdorff_directed_clipped(
+  py: Python<'_>,
   a: Vec<Point>,
   b: Vec<Point>,
   bounding_box: &BoundingBox,
@@ -834,18 +836,23 @@ fn hausdorff_directed_clipped(
   let points_b = map_to_points(&b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
-  hausdorff_kernel::hausdorff_directed_clipped(&points_a, &points_b, bbox)
+  py.detach(|| hausdorff_kernel::hausdorff_directed_clipped(&points_a, &points_b, bbox))
     .map(HausdorffDirectedWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_clipped(a: Vec<Point>, b: Vec<Point>, bounding_box: &BoundingBox) -> PyResult<HausdorffWitness> {
+fn hausdorff_clipped(
+  py: Python<'_>,
+  a: Vec<Point>,
+  b: Vec<Point>,
+  bounding_box: &BoundingBox,
+) -> PyResult<HausdorffWitness> {
   let points_a = map_to_points(&a)?;
   let points_b = map_to_points(&b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
-  hausdorff_kernel::hausdorff_clipped(&points_a, &points_b, bbox)
+  py.detach(|| hausdorff_kernel::hausdorff_clipped(&points_a, &points_b, bbox))
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
 }
@@ -853,6 +860,7 @@ fn hausdorff_clipped(a: Vec<Point>, b: Vec<Point>, bounding_box: &BoundingBox) -
 #[pyfunction]
 #[pyo3(signature = (a, b, options = None))]
 fn hausdorff_directed_polyline(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   options: Option<&PyDensificationOptions>,
@@ -861,7 +869,7 @@ fn hausdorff_directed_polyline(
   let parts_b = map_to_multiline(&b);
   let densification_options = map_densification_options(options)?;
 
-  hausdorff_kernel::hausdorff_directed_polyline(&parts_a, &parts_b, densification_options)
+  py.detach(|| hausdorff_kernel::hausdorff_directed_polyline(&parts_a, &parts_b, densification_options))
     .map(PolylineDirectedWitness::from)
     .map_err(map_geodist_error)
 }
@@ -869,6 +877,7 @@ fn hausdorff_directed_polyline(
 #[pyfunction]
 #[pyo3(signature = (a, b, options = None))]
 fn hausdorff_polyline(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   options: Option<&PyDensificationOptions>,
@@ -877,7 +886,7 @@ fn hausdorff_polyline(
   let parts_b = map_to_multiline(&b);
   let densification_options = map_densification_options(options)?;
 
-  hausdorff_kernel::hausdorff_polyline(&parts_a, &parts_b, densification_options)
+  py.detach(|| hausdorff_kernel::hausdorff_polyline(&parts_a, &parts_b, densification_options))
     .map(PolylineHausdorffWitness::from)
     .map_err(map_geodist_error)
 }
@@ -885,6 +894,7 @@ fn hausdorff_polyline(
 #[pyfunction]
 #[pyo3(signature = (a, b, reduction = "mean", options = None))]
 fn chamfer_directed_polyline(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   reduction: &str,
@@ -895,7 +905,7 @@ fn chamfer_directed_polyline(
   let densification_options = map_densification_options(options)?;
   let reduction = map_chamfer_reduction(reduction)?;
 
-  chamfer_kernel::chamfer_directed_polyline(&parts_a, &parts_b, densification_options, reduction)
+  py.detach(|| chamfer_kernel::chamfer_directed_polyline(&parts_a, &parts_b, densification_options, reduction))
     .map(ChamferDirectedResult::from)
     .map_err(map_geodist_error)
 }
@@ -903,6 +913,7 @@ fn chamfer_directed_polyline(
 #[pyfunction]
 #[pyo3(signature = (a, b, reduction = "mean", options = None))]
 fn chamfer_polyline(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   reduction: &str,
@@ -913,7 +924,7 @@ fn chamfer_polyline(
   let densification_options = map_densification_options(options)?;
   let reduction = map_chamfer_reduction(reduction)?;
 
-  chamfer_kernel::chamfer_polyline(&parts_a, &parts_b, densification_options, reduction)
+  py.detach(|| chamfer_kernel::chamfer_polyline(&parts_a, &parts_b, densification_options, reduction))
     .map(ChamferResult::from)
     .map_err(map_geodist_error)
 }
@@ -921,6 +932,7 @@ fn chamfer_polyline(
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, options = None))]
 fn hausdorff_directed_polyline_clipped(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   bounding_box: &BoundingBox,
@@ -931,7 +943,7 @@ fn hausdorff_directed_polyline_clipped(
   let bbox = map_to_bounding_box(bounding_box)?;
   let densification_options = map_densification_options(options)?;
 
-  hausdorff_kernel::hausdorff_directed_polyline_clipped(&parts_a, &parts_b, densification_options, bbox)
+  py.detach(|| hausdorff_kernel::hausdorff_directed_polyline_clipped(&parts_a, &parts_b, densification_options, bbox))
     .map(PolylineDirectedWitness::from)
     .map_err(map_geodist_error)
 }
@@ -939,6 +951,7 @@ fn hausdorff_directed_polyline_clipped(
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, options = None))]
 fn hausdorff_polyline_clipped(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   bounding_box: &BoundingBox,
@@ -949,7 +962,7 @@ fn hausdorff_polyline_clipped(
   let bbox = map_to_bounding_box(bounding_box)?;
   let densification_options = map_densification_options(options)?;
 
-  hausdorff_kernel::hausdorff_polyline_clipped(&parts_a, &parts_b, densification_options, bbox)
+  py.detach(|| hausdorff_kernel::hausdorff_polyline_clipped(&parts_a, &parts_b, densification_options, bbox))
     .map(PolylineHausdorffWitness::from)
     .map_err(map_geodist_error)
 }
@@ -957,6 +970,7 @@ fn hausdorff_polyline_clipped(
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, reduction = "mean", options = None))]
 fn chamfer_directed_polyline_clipped(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   bounding_box: &BoundingBox,
@@ -969,14 +983,17 @@ fn chamfer_directed_polyline_clipped(
   let densification_options = map_densification_options(options)?;
   let reduction = map_chamfer_reduction(reduction)?;
 
-  chamfer_kernel::chamfer_directed_polyline_clipped(&parts_a, &parts_b, densification_options, reduction, bbox)
-    .map(ChamferDirectedResult::from)
-    .map_err(map_geodist_error)
+  py.detach(|| {
+    chamfer_kernel::chamfer_directed_polyline_clipped(&parts_a, &parts_b, densification_options, reduction, bbox)
+  })
+  .map(ChamferDirectedResult::from)
+  .map_err(map_geodist_error)
 }
 
 #[pyfunction]
 #[pyo3(signature = (a, b, bounding_box, reduction = "mean", options = None))]
 fn chamfer_polyline_clipped(
+  py: Python<'_>,
   a: Vec<Polyline>,
   b: Vec<Polyline>,
   bounding_box: &BoundingBox,
@@ -989,33 +1006,34 @@ fn chamfer_polyline_clipped(
   let densification_options = map_densification_options(options)?;
   let reduction = map_chamfer_reduction(reduction)?;
 
-  chamfer_kernel::chamfer_polyline_clipped(&parts_a, &parts_b, densification_options, reduction, bbox)
+  py.detach(|| chamfer_kernel::chamfer_polyline_clipped(&parts_a, &parts_b, densification_options, reduction, bbox))
     .map(ChamferResult::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_directed_3d(a: Vec<Point3D>, b: Vec<Point3D>) -> PyResult<HausdorffDirectedWitness> {
+fn hausdorff_directed_3d(py: Python<'_>, a: Vec<Point3D>, b: Vec<Point3D>) -> PyResult<HausdorffDirectedWitness> {
   let points_a = map_to_points3d(&a)?;
   let points_b = map_to_points3d(&b)?;
 
-  hausdorff_kernel::hausdorff_directed_3d(&points_a, &points_b)
+  py.detach(|| hausdorff_kernel::hausdorff_directed_3d(&points_a, &points_b))
     .map(HausdorffDirectedWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_3d(a: Vec<Point3D>, b: Vec<Point3D>) -> PyResult<HausdorffWitness> {
+fn hausdorff_3d(py: Python<'_>, a: Vec<Point3D>, b: Vec<Point3D>) -> PyResult<HausdorffWitness> {
   let points_a = map_to_points3d(&a)?;
   let points_b = map_to_points3d(&b)?;
 
-  hausdorff_kernel::hausdorff_3d(&points_a, &points_b)
+  py.detach(|| hausdorff_kernel::hausdorff_3d(&points_a, &points_b))
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
 fn hausdorff_directed_clipped_3d(
+  py: Python<'_>,
   a: Vec<Point3D>,
   b: Vec<Point3D>,
   bounding_box: &BoundingBox,
@@ -1024,24 +1042,30 @@ fn hausdorff_directed_clipped_3d(
   let points_b = map_to_points3d(&b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
-  hausdorff_kernel::hausdorff_directed_clipped_3d(&points_a, &points_b, bbox)
+  py.detach(|| hausdorff_kernel::hausdorff_directed_clipped_3d(&points_a, &points_b, bbox))
     .map(HausdorffDirectedWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
-fn hausdorff_clipped_3d(a: Vec<Point3D>, b: Vec<Point3D>, bounding_box: &BoundingBox) -> PyResult<HausdorffWitness> {
+fn hausdorff_clipped_3d(
+  py: Python<'_>,
+  a: Vec<Point3D>,
+  b: Vec<Point3D>,
+  bounding_box: &BoundingBox,
+) -> PyResult<HausdorffWitness> {
   let points_a = map_to_points3d(&a)?;
   let points_b = map_to_points3d(&b)?;
   let bbox = map_to_bounding_box(bounding_box)?;
 
-  hausdorff_kernel::hausdorff_clipped_3d(&points_a, &points_b, bbox)
+  py.detach(|| hausdorff_kernel::hausdorff_clipped_3d(&points_a, &points_b, bbox))
     .map(HausdorffWitness::from)
     .map_err(map_geodist_error)
 }
 
 #[pyfunction]
 fn hausdorff_polygon_boundary(
+  py: Python<'_>,
   a: &Polygon,
   b: &Polygon,
   max_segment_length_m: Option<f64>,
@@ -1049,7 +1073,7 @@ fn hausdorff_polygon_boundary(
   sample_cap: usize,
 ) -> PyResult<f64> {
   let options = map_boundary_densification_opts(max_segment_length_m, max_segment_angle_deg, sample_cap)?;
-  polygon_kernel::hausdorff_boundary(&a.inner, &b.inner, options)
+  py.detach(|| polygon_kernel::hausdorff_boundary(&a.inner, &b.inner, options))
     .map(|witness| witness.distance().meters())
     .map_err(map_geodist_error)
 }
@@ -1226,8 +1250,7 @@ fn geodesic_distance_batch(
 
   let ellipsoid_axes = ellipsoid_axes(ellipsoid)?;
 
-  #[allow(deprecated)]
-  let distances = py.allow_threads(|| -> PyResult<Vec<f64>> {
+  let distances = py.detach(|| -> PyResult<Vec<f64>> {
     match ellipsoid_axes {
       Some((semi_major, semi_minor)) => {
         let flattening = 1.0 - (semi_minor / semi_major);
@@ -1247,7 +1270,7 @@ fn geodesic_distance_batch(
       None => {
         let mut out = Vec::with_capacity(count);
         for idx in 0..count {
-          let (meters, _, _) = distance::spherical_distance_and_bearings(
+          let meters = distance::spherical_distance(
             origins.lat[idx],
             origins.lon[idx],
             destinations.lat[idx],
@@ -1290,8 +1313,7 @@ fn geodesic_with_bearings_batch(
 
   let ellipsoid_axes = ellipsoid_axes(ellipsoid)?;
 
-  #[allow(deprecated)]
-  let (distances, initials, finals) = py.allow_threads(|| -> PyResult<(Vec<f64>, Vec<f64>, Vec<f64>)> {
+  let (distances, initials, finals) = py.detach(|| -> PyResult<(Vec<f64>, Vec<f64>, Vec<f64>)> {
     match ellipsoid_axes {
       Some((semi_major, semi_minor)) => {
         let flattening = 1.0 - (semi_minor / semi_major);
@@ -1372,31 +1394,26 @@ fn geodesic_distance_to_many(
 
         Ok(out)
       }
-      None => {
-        let mut out = Vec::with_capacity(count);
-        for idx in 0..count {
-          let (meters, _, _) = distance::spherical_distance_and_bearings(
-            origin_lat,
-            origin_lon,
-            destinations.lat[idx],
-            destinations.lon[idx],
-          );
-          out.push(meters);
-        }
-        Ok(out)
-      }
+      None => Ok(distance::spherical_distances_from_with_radius(
+        EARTH_RADIUS_METERS,
+        origin_lat,
+        origin_lon,
+        &destinations.lat,
+        &destinations.lon,
+      )),
     }
   })?;
 
   Ok(distances)
 }
 
-/// Extract a monotonic offset vector from Python buffers or sequences.
-///
-/// Supports `usize`/`i64` contiguous buffers to avoid copies, falling back
-/// to sequence extraction. Negative values are rejected for signed buffers.
-fn extract_offsets(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str) -> PyResult<Vec<usize>> {
-  if let Ok(buffer) = PyBuffer::<usize>::get(obj) {
+/// Extract non-negative offsets from a signed integer buffer, if `obj`
+/// exposes one with element type `T`.
+fn extract_signed_offsets<T>(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str) -> PyResult<Option<Vec<usize>>>
+where
+  T: pyo3::buffer::Element + Copy + Into<i64>,
+{
+  if let Ok(buffer) = PyBuffer::<T>::get(obj) {
     if buffer.dimensions() > 1 || !buffer.is_c_contiguous() {
       return Err(PyValueError::new_err(format!(
         "{name} must be a contiguous 1-D integer buffer, got {} dimensions",
@@ -1405,13 +1422,32 @@ fn extract_offsets(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str) -> PyResu
     }
 
     if let Some(slice) = buffer.as_slice(py) {
-      return Ok(slice.iter().map(ReadOnlyCell::get).collect());
+      let mut out = Vec::with_capacity(slice.len());
+      for value in slice {
+        let value: i64 = value.get().into();
+        if value < 0 {
+          return Err(InvalidGeometryError::new_err(format!(
+            "{name} must be non-negative, got {value}"
+          )));
+        }
+        out.push(value as usize);
+      }
+      return Ok(Some(out));
     }
 
     return Err(PyValueError::new_err(format!("{name} must expose a readable buffer")));
   }
 
-  if let Ok(buffer) = PyBuffer::<i64>::get(obj) {
+  Ok(None)
+}
+
+/// Extract a monotonic offset vector from Python buffers or sequences.
+///
+/// Supports `usize`/`i64`/`i32` contiguous buffers (`i32` being the Arrow
+/// offset width) to avoid per-element extraction, falling back to sequence
+/// extraction. Negative values are rejected for signed buffers.
+fn extract_offsets(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str) -> PyResult<Vec<usize>> {
+  if let Ok(buffer) = PyBuffer::<usize>::get(obj) {
     if buffer.dimensions() > 1 || !buffer.is_c_contiguous() {
       return Err(PyValueError::new_err(format!(
         "{name} must be a contiguous 1-D integer buffer, got {} dimensions",
@@ -1420,22 +1456,20 @@ fn extract_offsets(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str) -> PyResu
     }
 
     if let Some(slice) = buffer.as_slice(py) {
-      let mut out = Vec::with_capacity(slice.len());
-      for value in slice {
-        let value = value.get();
-        if value < 0 {
-          return Err(InvalidGeometryError::new_err(format!(
-            "{name} must be non-negative, got {value}"
-          )));
-        }
-        out.push(value as usize);
-      }
-      return Ok(out);
+      return Ok(slice.iter().map(ReadOnlyCell::get).collect());
     }
 
     return Err(PyValueError::new_err(format!("{name} must expose a readable buffer")));
   }
 
+  if let Some(offsets) = extract_signed_offsets::<i64>(py, obj, name)? {
+    return Ok(offsets);
+  }
+
+  if let Some(offsets) = extract_signed_offsets::<i32>(py, obj, name)? {
+    return Ok(offsets);
+  }
+
   obj.extract::<Vec<usize>>()
 }
 
@@ -1615,53 +1649,225 @@ fn polygon_area_batch(
   let flattening = 1.0 - (semi_minor / semi_major);
   let geodesic = GeographicGeodesic::new(semi_major, flattening);
 
-  let mut areas = Vec::with_capacity(polygon_offsets.len().saturating_sub(1));
+  let areas = py.detach(|| -> PyResult<Vec<f64>> {
+    let mut areas = Vec::with_capacity(polygon_offsets.len().saturating_sub(1));
 
-  for (polygon_index, window) in polygon_offsets.windows(2).enumerate() {
-    let ring_start = window[0];
-    let ring_end = window[1];
+    for (polygon_index, window) in polygon_offsets.windows(2).enumerate() {
+      let ring_start = window[0];
+      let ring_end = window[1];
 
-    if ring_end < ring_start || ring_end > ring_offsets.len().saturating_sub(1) {
-      return Err(InvalidGeometryError::new_err(format!(
-        "polygon {polygon_index} has invalid ring offsets {ring_start}..{ring_end}"
-      )));
-    }
+      if ring_end < ring_start || ring_end > ring_offsets.len().saturating_sub(1) {
+        return Err(InvalidGeometryError::new_err(format!(
+          "polygon {polygon_index} has invalid ring offsets {ring_start}..{ring_end}"
+        )));
+      }
 
-    if ring_start == ring_end {
-      areas.push(0.0);
-      continue;
-    }
+      if ring_start == ring_end {
+        areas.push(0.0);
+        continue;
+      }
 
-    let exterior_area = compute_ring_area(
-      &geodesic,
-      &coords,
-      ring_offsets[ring_start],
-      ring_offsets[ring_start + 1],
-      polygon_index,
-      ring_start,
-    )?;
-
-    let mut holes_area = 0.0;
-    for ring_index in (ring_start + 1)..ring_end {
-      let ring_area = compute_ring_area(
+      let exterior_area = compute_ring_area(
         &geodesic,
         &coords,
-        ring_offsets[ring_index],
-        ring_offsets[ring_index + 1],
+        ring_offsets[ring_start],
+        ring_offsets[ring_start + 1],
         polygon_index,
-        ring_index,
+        ring_start,
       )?;
-      holes_area += ring_area;
+
+      let mut holes_area = 0.0;
+      for ring_index in (ring_start + 1)..ring_end {
+        let ring_area = compute_ring_area(
+          &geodesic,
+          &coords,
+          ring_offsets[ring_index],
+          ring_offsets[ring_index + 1],
+          polygon_index,
+          ring_index,
+        )?;
+        holes_area += ring_area;
+      }
+
+      let mut net = exterior_area - holes_area;
+      if net < 0.0 {
+        net = 0.0;
+      }
+      areas.push(net);
     }
 
-    let mut net = exterior_area - holes_area;
-    if net < 0.0 {
-      net = 0.0;
+    Ok(areas)
+  })?;
+
+  Ok(areas)
+}
+
+#[pyfunction]
+fn geodesic_distance_matrix(
+  py: Python<'_>,
+  a_lat: &Bound<'_, PyAny>,
+  a_lon: &Bound<'_, PyAny>,
+  b_lat: &Bound<'_, PyAny>,
+  b_lon: &Bound<'_, PyAny>,
+  ellipsoid: Option<&Ellipsoid>,
+) -> PyResult<Vec<f64>> {
+  let a = load_lat_lon_buffers(py, a_lat, a_lon, "a")?;
+  let b = load_lat_lon_buffers(py, b_lat, b_lon, "b")?;
+
+  if a.lat.is_empty() || b.lat.is_empty() {
+    return Ok(Vec::new());
+  }
+
+  let Some(pair_count) = a.lat.len().checked_mul(b.lat.len()) else {
+    return Err(PyValueError::new_err(format!(
+      "distance matrix of {} x {} points is too large",
+      a.lat.len(),
+      b.lat.len()
+    )));
+  };
+
+  // Route through `Geographiclib` so WGS84 reuses the shared, precomputed solver.
+  let solver = ellipsoid
+    .map(|model| map_to_ellipsoid(model).and_then(|model| map_geodist_result(Geographiclib::from_ellipsoid(model))))
+    .transpose()?;
+
+  py.detach(|| -> Result<Vec<f64>, types::GeodistError> {
+    match solver {
+      Some(solver) => {
+        let mut out = Vec::with_capacity(pair_count);
+
+        for (&origin_lat, &origin_lon) in a.lat.iter().zip(&a.lon) {
+          let origin = types::Point::new_unchecked(origin_lat, origin_lon);
+          for (&lat, &lon) in b.lat.iter().zip(&b.lon) {
+            let meters = solver
+              .geodesic_distance(origin, types::Point::new_unchecked(lat, lon))?
+              .meters();
+            out.push(meters);
+          }
+        }
+
+        Ok(out)
+      }
+      None => Ok(distance::spherical_distance_matrix_with_radius(
+        EARTH_RADIUS_METERS,
+        &a.lat,
+        &a.lon,
+        &b.lat,
+        &b.lon,
+      )),
     }
-    areas.push(net);
+  })
+  .map_err(map_geodist_error)
+}
+
+/// Extract an altitude buffer and check that it is finite and matches the
+/// coordinate count of its companion latitude/longitude buffers.
+fn load_altitude_buffer(py: Python<'_>, obj: &Bound<'_, PyAny>, name: &str, expected: usize) -> PyResult<Vec<f64>> {
+  let altitudes = extract_f64_vector(py, obj, &format!("{name}.alt"))?;
+
+  if altitudes.len() != expected {
+    return Err(PyValueError::new_err(format!(
+      "{name}.alt must match coordinate length, got {} vs {expected}",
+      altitudes.len()
+    )));
   }
 
-  Ok(areas)
+  if let Some(index) = altitudes.iter().position(|value| !value.is_finite()) {
+    return Err(InvalidGeometryError::new_err(format!(
+      "index {index}: altitude must be finite, got {}",
+      altitudes[index]
+    )));
+  }
+
+  Ok(altitudes)
+}
+
+#[pyfunction]
+fn geodesic_distance_3d_batch(
+  py: Python<'_>,
+  origins_lat: &Bound<'_, PyAny>,
+  origins_lon: &Bound<'_, PyAny>,
+  origins_alt: &Bound<'_, PyAny>,
+  destinations_lat: &Bound<'_, PyAny>,
+  destinations_lon: &Bound<'_, PyAny>,
+  destinations_alt: &Bound<'_, PyAny>,
+) -> PyResult<Vec<f64>> {
+  let origins = load_lat_lon_buffers(py, origins_lat, origins_lon, "origins")?;
+  let destinations = load_lat_lon_buffers(py, destinations_lat, destinations_lon, "destinations")?;
+
+  if origins.lat.len() != destinations.lat.len() {
+    return Err(PyValueError::new_err(format!(
+      "origins and destinations must share length, got {} and {}",
+      origins.lat.len(),
+      destinations.lat.len()
+    )));
+  }
+
+  let count = origins.lat.len();
+  let origins_alt = load_altitude_buffer(py, origins_alt, "origins", count)?;
+  let destinations_alt = load_altitude_buffer(py, destinations_alt, "destinations", count)?;
+
+  if count == 0 {
+    return Ok(Vec::new());
+  }
+
+  let ellipsoid = types::Ellipsoid::wgs84();
+  py.detach(|| -> Result<Vec<f64>, types::GeodistError> {
+    let mut out = Vec::with_capacity(count);
+    for idx in 0..count {
+      // Coordinates were validated on load, so the points can be built directly.
+      let origin = types::Point3D::new_unchecked(origins.lat[idx], origins.lon[idx], origins_alt[idx]);
+      let destination =
+        types::Point3D::new_unchecked(destinations.lat[idx], destinations.lon[idx], destinations_alt[idx]);
+      let origin_ecef = distance::geodetic_to_ecef(origin, &ellipsoid)?;
+      let destination_ecef = distance::geodetic_to_ecef(destination, &ellipsoid)?;
+      out.push(origin_ecef.distance_to(destination_ecef));
+    }
+    Ok(out)
+  })
+  .map_err(map_geodist_error)
+}
+
+fn buffer_points(buffers: LatLonBuffers) -> Vec<types::Point> {
+  // `load_lat_lon_buffers` already validated every coordinate, so the points can be built directly.
+  buffers
+    .lat
+    .into_iter()
+    .zip(buffers.lon)
+    .map(|(lat, lon)| types::Point::new_unchecked(lat, lon))
+    .collect()
+}
+
+#[pyfunction]
+fn hausdorff_directed_batch(
+  py: Python<'_>,
+  a_lat: &Bound<'_, PyAny>,
+  a_lon: &Bound<'_, PyAny>,
+  b_lat: &Bound<'_, PyAny>,
+  b_lon: &Bound<'_, PyAny>,
+) -> PyResult<HausdorffDirectedWitness> {
+  let points_a = buffer_points(load_lat_lon_buffers(py, a_lat, a_lon, "a")?);
+  let points_b = buffer_points(load_lat_lon_buffers(py, b_lat, b_lon, "b")?);
+
+  py.detach(|| hausdorff_kernel::hausdorff_directed(&points_a, &points_b))
+    .map(HausdorffDirectedWitness::from)
+    .map_err(map_geodist_error)
+}
+
+#[pyfunction]
+fn hausdorff_batch(
+  py: Python<'_>,
+  a_lat: &Bound<'_, PyAny>,
+  a_lon: &Bound<'_, PyAny>,
+  b_lat: &Bound<'_, PyAny>,
+  b_lon: &Bound<'_, PyAny>,
+) -> PyResult<HausdorffWitness> {
+  let points_a = buffer_points(load_lat_lon_buffers(py, a_lat, a_lon, "a")?);
+  let points_b = buffer_points(load_lat_lon_buffers(py, b_lat, b_lon, "b")?);
+
+  py.detach(|| hausdorff_kernel::hausdorff(&points_a, &points_b))
+    .map(HausdorffWitness::from)
+    .map_err(map_geodist_error)
 }
 
 #[pymodule]
@@ -1718,5 +1924,9 @@ fn _loxodrome_rs(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
   m.add_function(wrap_pyfunction!(geodesic_with_bearings_batch, m)?)?;
   m.add_function(wrap_pyfunction!(geodesic_distance_to_many, m)?)?;
   m.add_function(wrap_pyfunction!(polygon_area_batch, m)?)?;
+  m.add_function(wrap_pyfunction!(geodesic_distance_matrix, m)?)?;
+  m.add_function(wrap_pyfunction!(geodesic_distance_3d_batch, m)?)?;
+  m.add_function(wrap_pyfunction!(hausdorff_directed_batch, m)?)?;
+  m.add_function(wrap_pyfunction!(hausdorff_batch, m)?)?;
   Ok(())
 }
@@ -235,6 +235,33 @@ def polygon_area_batch(
     polygon_offsets: object,
     ellipsoid: Ellipsoid | None = ...,
 ) -> list[float]: ...
+def geodesic_distance_matrix(
+    a_lat: object,
+    a_lon: object,
+    b_lat: object,
+    b_lon: object,
+    ellipsoid: Ellipsoid | None = ...,
+) -> list[float]: ...
+def geodesic_distance_3d_batch(
+    origins_lat: object,
+    origins_lon: object,
+    origins_alt: object,
+    destinations_lat: object,
+    destinations_lon: object,
+    destinations_alt: object,
+) -> list[float]: ...
+def hausdorff_directed_batch(
+    a_lat: object,
+    a_lon: object,
+    b_lat: object,
+    b_lon: object,
+) -> HausdorffDirectedWitness: ...
+def hausdorff_batch(
+    a_lat: object,
+    a_lon: object,
+    b_lat: object,
+    b_lon: object,
+) -> HausdorffWitness: ...
 
 __all__ = [
     "EARTH_RADIUS_METERS",
@@ -288,6 +315,10 @@ __all__ = [
     "geodesic_with_bearings_batch",
     "geodesic_distance_to_many",
     "polygon_area_batch",
+    "geodesic_distance_matrix",
+    "geodesic_distance_3d_batch",
+    "hausdorff_directed_batch",
+    "hausdorff_batch",
 ]
 
 # Upcoming Rust-backed geometry handles will mirror the Rust structs once exposed:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import importlib.metadata
+import functools
 import importlib.util
 from typing import TYPE_CHECKING
 
@@ -55,6 +55,9 @@ app = typer.Typer(
 @app.command()
 def info() -> None:
     """Show package version and whether the Rust extension is importable."""
+    # Deferred: importlib.metadata pulls in the email parser and is only needed here.
+    import importlib.metadata
+
     version = importlib.metadata.version("loxodrome")
     typer.echo(f"loxodrome version: {version}")
     typer.echo(f"Shapely interop helpers: {_shapely_interop_status()}")
@@ -222,8 +225,12 @@ def demo() -> None:
     hausdorff(clip=True)
 
 
+@functools.cache
 def _shapely_interop_status() -> str:
-    """Return a short status string for optional Shapely helpers."""
+    """Return a short status string for optional Shapely helpers.
+
+    Probing ``shapely.geometry`` imports the parent package, so the result is cached for the process.
+    """
     return "available" if importlib.util.find_spec("shapely.geometry") else "not installed"
 
 
@@ -5,12 +5,13 @@ Imports are guarded so Shapely remains an opt-in dependency.
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol, cast, runtime_checkable
 
 from ..errors import InvalidGeometryError
 from ..geometry import BoundingBox, LineString, Point, Point3D
 
 try:
+    import shapely
     from shapely.geometry import LineString as ShapelyLineString
     from shapely.geometry import Point as ShapelyPoint
     from shapely.geometry import Polygon as ShapelyPolygon
@@ -20,7 +21,14 @@ except ModuleNotFoundError as exc:
         "Shapely is required for interop helpers; install the optional extra with "
         "`pip install loxodrome[shapely]` or add `shapely` to your environment."
     ) from exc
-__all__ = ("from_shapely", "to_shapely")
+
+# Shapely requires numpy, so these only run once the guard above has passed.
+import numpy as _np
+import numpy.typing as _npt
+
+from ..vectorized import Point3DBatch, PointBatch
+
+__all__ = ("from_shapely", "to_shapely", "to_shapely_many")
 
 
 @runtime_checkable
@@ -61,6 +69,21 @@ def to_shapely(geometry: Point | Point3D | BoundingBox | LineString) -> Any:
     )
 
 
+def to_shapely_many(points: PointBatch | Point3DBatch) -> list[Any]:
+    """Convert a point batch into Shapely points with one vectorized constructor call."""
+    if not isinstance(points, (PointBatch, Point3DBatch)):
+        raise TypeError(f"to_shapely_many expects a PointBatch or Point3DBatch, got {type(points).__name__}")
+
+    lon = _np.asarray(points.lon_deg)
+    lat = _np.asarray(points.lat_deg)
+    if isinstance(points, Point3DBatch):
+        geometries = shapely.points(lon, lat, _np.asarray(points.altitude_m))
+    else:
+        geometries = shapely.points(lon, lat)
+    # 1-D coordinate columns always yield an object array, never a single Point.
+    return list(cast(_npt.NDArray[_np.object_], geometries))
+
+
 def from_shapely(geometry: _PointLike | _PolygonLike) -> Point | Point3D | BoundingBox | LineString:
     """Convert a Shapely geometry into a loxodrome geometry."""
     if isinstance(geometry, ShapelyPoint):
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from math import isfinite
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from . import _loxodrome_rs
 from .errors import InvalidGeometryError
@@ -13,6 +13,9 @@ from .types import BoundingBox as BoundingBoxTuple
 from .types import Point as PointTuple
 from .types import Point3D as Point3DTuple
 
+if TYPE_CHECKING:  # pragma: no cover - import guard for type checking only
+    from .vectorized import ArrayLike
+
 __all__ = (
     "Ellipsoid",
     "Point",
@@ -22,56 +25,70 @@ __all__ = (
     "LineString",
 )
 
+# Bound once so the per-instance constructor calls skip the module attribute lookup.
+_RS_POINT = _loxodrome_rs.Point
+_RS_POINT3D = _loxodrome_rs.Point3D
+_RS_BOUNDING_BOX = _loxodrome_rs.BoundingBox
+
 
 class Ellipsoid:
     """Immutable ellipsoid definition expressed in meters."""
 
-    __slots__ = ("_handle",)
+    __slots__ = ("_handle", "_tuple")
 
     def __init__(self, semi_major_axis_m: float, semi_minor_axis_m: float) -> None:
         """Initialize an ellipsoid from semi-major/minor axes in meters."""
-        _validate_axis(semi_minor_axis_m, name="semi_minor_axis_m")
-        _validate_axis(semi_major_axis_m, name="semi_major_axis_m")
-
-        if semi_major_axis_m < semi_minor_axis_m:
+        # One chained check covers the valid case; the per-axis checks only run to pick the error message.
+        if not (
+            isfinite(semi_major_axis_m) and isfinite(semi_minor_axis_m) and 0.0 < semi_minor_axis_m <= semi_major_axis_m
+        ):
+            _validate_axis(semi_minor_axis_m, name="semi_minor_axis_m")
+            _validate_axis(semi_major_axis_m, name="semi_major_axis_m")
             raise InvalidGeometryError(
                 f"semi_major_axis_m must be >= semi_minor_axis_m: {semi_major_axis_m!r} < {semi_minor_axis_m!r}"
             )
 
         self._handle = _loxodrome_rs.Ellipsoid(semi_major_axis_m, semi_minor_axis_m)
+        self._tuple: tuple[float, float] | None = None
 
     @classmethod
     def _from_handle(cls, handle: _loxodrome_rs.Ellipsoid) -> "Ellipsoid":
         instance = cls.__new__(cls)
         instance._handle = handle
+        instance._tuple = None
         return instance
 
     @classmethod
     def wgs84(cls) -> "Ellipsoid":
-        """Return the WGS84 reference ellipsoid."""
-        return cls._from_handle(_loxodrome_rs.Ellipsoid.wgs84())
+        """Return the shared WGS84 reference ellipsoid."""
+        return _WGS84_ELLIPSOID
 
     @property
     def semi_major_axis_m(self) -> float:
         """Semi-major axis in meters."""
-        return float(self._handle.semi_major_axis_m)
+        return self.to_tuple()[0]
 
     @property
     def semi_minor_axis_m(self) -> float:
         """Semi-minor axis in meters."""
-        return float(self._handle.semi_minor_axis_m)
+        return self.to_tuple()[1]
 
     def to_tuple(self) -> tuple[float, float]:
         """Return a tuple representation `(semi_major_axis_m, semi_minor_axis_m)`."""
-        return self._handle.to_tuple()
+        # The handle is immutable, so one FFI read serves every later accessor.
+        axes = self._tuple
+        if axes is None:
+            axes = self._tuple = self._handle.to_tuple()
+        return axes
 
     def __iter__(self) -> Iterator[float]:
         """Iterate over the semi-major and semi-minor axes."""
-        yield from self.to_tuple()
+        return iter(self.to_tuple())
 
     def __repr__(self) -> str:
         """Return a string representation of the ellipsoid."""
-        return f"Ellipsoid(semi_major_axis_m={self.semi_major_axis_m}, semi_minor_axis_m={self.semi_minor_axis_m})"
+        semi_major_axis_m, semi_minor_axis_m = self.to_tuple()
+        return f"Ellipsoid(semi_major_axis_m={semi_major_axis_m}, semi_minor_axis_m={semi_minor_axis_m})"
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another Ellipsoid."""
@@ -80,56 +97,95 @@ class Ellipsoid:
         return self.to_tuple() == other.to_tuple()
 
 
+#: Shared WGS84 instance returned by :meth:`Ellipsoid.wgs84`; ellipsoids are immutable, so one copy serves every caller.
+_WGS84_ELLIPSOID = Ellipsoid._from_handle(_loxodrome_rs.Ellipsoid.wgs84())
+
+
 class Point:
     """Immutable geographic point expressed in degrees."""
 
-    __slots__ = ("_handle",)
+    __slots__ = ("_native", "_tuple")
 
     def __init__(self, lat: Latitude, lon: Longitude) -> None:
         """Initialize a Point from latitude and longitude in degrees."""
         latitude = _coerce_latitude(lat)
         longitude = _coerce_longitude(lon)
-        self._handle = _loxodrome_rs.Point(latitude, longitude)
+        self._native: _loxodrome_rs.Point | None = None
+        self._tuple = (latitude, longitude)
+
+    @classmethod
+    def from_arrays(cls, lat: ArrayLike, lon: ArrayLike) -> list["Point"]:
+        """Build Points from parallel latitude/longitude columns in degrees.
+
+        Requires numpy. The columns are validated in one vectorized pass rather than point by point, so large inputs
+        skip the per-coordinate Python coercion that `Point(lat, lon)` performs.
+        """
+        from .vectorized import points_from_coords
+
+        return [cls._from_coords(coords) for coords in points_from_coords(lat, lon).to_python()]
+
+    @property
+    def _handle(self) -> _loxodrome_rs.Point:
+        # Built on first use, since Points that are only inspected or compared never reach a Rust kernel.
+        handle = self._native
+        if handle is None:
+            handle = self._native = _RS_POINT(*self._tuple)
+        return handle
 
     @property
     def lat(self) -> Latitude:
         """Return the latitude in degrees."""
-        return float(self._handle.lat)
+        return self._tuple[0]
 
     @property
     def lon(self) -> Longitude:
         """Return the longitude in degrees."""
-        return float(self._handle.lon)
+        return self._tuple[1]
 
     def to_tuple(self) -> PointTuple:
         """Return a tuple representation for interoperability."""
-        return self._handle.to_tuple()
+        return self._tuple
 
     def __iter__(self) -> Iterator[float]:
         """Iterate over the latitude and longitude in degrees."""
-        yield from self.to_tuple()
+        return iter(self._tuple)
 
     def __repr__(self) -> str:
         """Return a string representation of the Point."""
-        return f"Point(lat={self.lat}, lon={self.lon})"
+        lat, lon = self._tuple
+        return f"Point(lat={lat}, lon={lon})"
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another Point."""
         if not isinstance(other, Point):
             return NotImplemented
-        return self.to_tuple() == other.to_tuple()
+        return self._tuple == other._tuple
+
+    def __hash__(self) -> int:
+        """Hash consistently with equality so instances can be used in sets and as dict keys."""
+        return hash(self._tuple)
 
     @classmethod
-    def _from_handle(cls, handle: _loxodrome_rs.Point) -> "Point":
+    def _from_handle(cls, handle: _loxodrome_rs.Point, coords: PointTuple | None = None) -> "Point":
+        # Coordinates live on the wrapper as plain floats; the handle is only needed by the kernels.
         instance = cls.__new__(cls)
-        instance._handle = handle
+        instance._native = handle
+        instance._tuple = handle.to_tuple() if coords is None else coords
+        return instance
+
+    @classmethod
+    def _from_coords(cls, coords: PointTuple) -> "Point":
+        # Callers pass coordinates that were already validated; the handle is created lazily.
+        instance = cls.__new__(cls)
+        instance._native = None
+        instance._tuple = coords
         return instance
 
 
 class Point3D:
     """Immutable geographic point with altitude."""
 
-    __slots__ = ("_handle",)
+    __slots__ = ("_native", "_tuple")
 
     def __init__(
         self,
@@ -141,40 +197,53 @@ class Point3D:
         latitude = _coerce_latitude(lat)
         longitude = _coerce_longitude(lon)
         altitude = _coerce_altitude(altitude_m)
-        self._handle = _loxodrome_rs.Point3D(latitude, longitude, altitude)
+        self._native: _loxodrome_rs.Point3D | None = None
+        self._tuple = (latitude, longitude, altitude)
+
+    @property
+    def _handle(self) -> _loxodrome_rs.Point3D:
+        handle = self._native
+        if handle is None:
+            handle = self._native = _RS_POINT3D(*self._tuple)
+        return handle
 
     @property
     def lat(self) -> Latitude:
         """Return the latitude in degrees."""
-        return float(self._handle.lat)
+        return self._tuple[0]
 
     @property
     def lon(self) -> Longitude:
         """Return the longitude in degrees."""
-        return float(self._handle.lon)
+        return self._tuple[1]
 
     @property
     def altitude_m(self) -> AltitudeM:
         """Return the altitude in meters."""
-        return float(self._handle.altitude_m)
+        return self._tuple[2]
 
     def to_tuple(self) -> Point3DTuple:
         """Return a tuple representation for interoperability."""
-        return self._handle.to_tuple()
+        return self._tuple
 
     def __iter__(self) -> Iterator[float]:
         """Iterate over the latitude, longitude, and altitude."""
-        yield from self.to_tuple()
+        return iter(self._tuple)
 
     def __repr__(self) -> str:
         """Return a string representation of the 3D point."""
-        return f"Point3D(lat={self.lat}, lon={self.lon}, altitude_m={self.altitude_m})"
+        lat, lon, altitude_m = self._tuple
+        return f"Point3D(lat={lat}, lon={lon}, altitude_m={altitude_m})"
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another Point3D."""
         if not isinstance(other, Point3D):
             return NotImplemented
-        return self.to_tuple() == other.to_tuple()
+        return self._tuple == other._tuple
+
+    def __hash__(self) -> int:
+        """Hash consistently with equality so instances can be used in sets and as dict keys."""
+        return hash(self._tuple)
 
 
 _LATITUDE_MIN_DEGREES = -90.0
@@ -200,7 +269,11 @@ def _coerce_coordinate(
     name: str,
 ) -> float:
     """Convert an input into a finite float within the allowed bounds."""
-    if isinstance(value, bool):
+    # Exact floats in range need no conversion; NaN fails the chained comparison and takes the checked path below.
+    if type(value) is float and min_value <= value <= max_value:
+        return value
+
+    if type(value) is bool:
         raise InvalidGeometryError(f"{name} must be a float, not bool: {value!r}")
 
     try:
@@ -208,10 +281,10 @@ def _coerce_coordinate(
     except (TypeError, ValueError) as exc:
         raise InvalidGeometryError(f"{name} must be convertible to float: {value!r}") from exc
 
-    if not isfinite(numeric_value):
-        raise InvalidGeometryError(f"{name} must be finite: {numeric_value!r}")
-
-    if numeric_value < min_value or numeric_value > max_value:
+    # NaN fails the chained comparison too, so finiteness is only inspected to choose the error message.
+    if not (min_value <= numeric_value <= max_value):
+        if not isfinite(numeric_value):
+            raise InvalidGeometryError(f"{name} must be finite: {numeric_value!r}")
         raise InvalidGeometryError(f"{name} {numeric_value!r} outside valid range [{min_value}, {max_value}]")
 
     return numeric_value
@@ -236,7 +309,10 @@ def _coerce_longitude(lon: float) -> Longitude:
 
 
 def _coerce_altitude(altitude_m: float) -> AltitudeM:
-    if isinstance(altitude_m, bool):
+    if type(altitude_m) is float and isfinite(altitude_m):
+        return altitude_m
+
+    if type(altitude_m) is bool:
         raise InvalidGeometryError(f"altitude_m must be a float, not bool: {altitude_m!r}")
 
     try:
@@ -262,7 +338,7 @@ def _coerce_point_like(value: Point | PointTuple) -> PointTuple:
 class BoundingBox:
     """Immutable geographic bounding box expressed in degrees."""
 
-    __slots__ = ("_handle",)
+    __slots__ = ("_native", "_tuple")
 
     def __init__(
         self,
@@ -272,6 +348,21 @@ class BoundingBox:
         max_lon: Longitude,
     ) -> None:
         """Initialize a BoundingBox from min/max latitude and longitude in degrees."""
+        # Plain floats that satisfy every bound in one chained comparison skip per-field coercion; NaN fails the
+        # comparisons, so anything unusual falls through to the checks below for a precise error.
+        if (
+            type(min_lat) is float
+            and type(max_lat) is float
+            and type(min_lon) is float
+            and type(max_lon) is float
+            and _LATITUDE_MIN_DEGREES <= min_lat <= max_lat <= _LATITUDE_MAX_DEGREES
+            and _LONGITUDE_MIN_DEGREES <= min_lon <= _LONGITUDE_MAX_DEGREES
+            and _LONGITUDE_MIN_DEGREES <= max_lon <= _LONGITUDE_MAX_DEGREES
+        ):
+            self._native: _loxodrome_rs.BoundingBox | None = None
+            self._tuple = (min_lat, max_lat, min_lon, max_lon)
+            return
+
         min_latitude = _coerce_latitude(min_lat)
         max_latitude = _coerce_latitude(max_lat)
         min_longitude = _coerce_longitude(min_lon)
@@ -280,57 +371,59 @@ class BoundingBox:
         if min_latitude > max_latitude:
             raise InvalidGeometryError(f"min_lat must not exceed max_lat: {min_latitude} > {max_latitude}")
 
-        self._handle = _loxodrome_rs.BoundingBox(
-            min_latitude,
-            max_latitude,
-            min_longitude,
-            max_longitude,
-        )
+        self._native = None
+        self._tuple = (min_latitude, max_latitude, min_longitude, max_longitude)
+
+    @property
+    def _handle(self) -> _loxodrome_rs.BoundingBox:
+        # The bounds were validated above with the same rules the Rust constructor applies, so it can be deferred.
+        handle = self._native
+        if handle is None:
+            handle = self._native = _RS_BOUNDING_BOX(*self._tuple)
+        return handle
 
     @property
     def min_lat(self) -> Latitude:
         """Return the minimum latitude in degrees."""
-        return float(self._handle.min_lat)
+        return self._tuple[0]
 
     @property
     def max_lat(self) -> Latitude:
         """Return the maximum latitude in degrees."""
-        return float(self._handle.max_lat)
+        return self._tuple[1]
 
     @property
     def min_lon(self) -> Longitude:
         """Return the minimum longitude in degrees."""
-        return float(self._handle.min_lon)
+        return self._tuple[2]
 
     @property
     def max_lon(self) -> Longitude:
         """Return the maximum longitude in degrees."""
-        return float(self._handle.max_lon)
+        return self._tuple[3]
 
     def to_tuple(self) -> BoundingBoxTuple:
         """Return the bounding box as a tuple of degrees."""
-        return self._handle.to_tuple()
+        return self._tuple
 
     def __iter__(self) -> Iterator[float]:
         """Iterate over the bounding box coordinates in degrees."""
-        yield from self.to_tuple()
+        return iter(self._tuple)
 
     def __repr__(self) -> str:
         """Return a string representation of the BoundingBox."""
-        return (
-            "BoundingBox("
-            f"min_lat={self.min_lat}, "
-            f"max_lat={self.max_lat}, "
-            f"min_lon={self.min_lon}, "
-            f"max_lon={self.max_lon}"
-            ")"
-        )
+        min_lat, max_lat, min_lon, max_lon = self._tuple
+        return f"BoundingBox(min_lat={min_lat}, max_lat={max_lat}, min_lon={min_lon}, max_lon={max_lon})"
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another BoundingBox."""
         if not isinstance(other, BoundingBox):
             return NotImplemented
-        return self.to_tuple() == other.to_tuple()
+        return self._tuple == other._tuple
+
+    def __hash__(self) -> int:
+        """Hash consistently with equality so instances can be used in sets and as dict keys."""
+        return hash(self._tuple)
 
 
 class Polygon:
@@ -384,8 +477,9 @@ class LineString:
 
     def __iter__(self) -> Iterator[Point]:
         """Iterate over vertices as Point instances."""
-        for lat, lon in self.to_tuple():
-            yield Point(lat, lon)
+        # Vertices were validated when the LineString was built, so skip the Python-side coercion.
+        for coords in self._handle.to_tuple():
+            yield Point._from_coords(coords)
 
     def __len__(self) -> int:
         """Return the number of vertices."""
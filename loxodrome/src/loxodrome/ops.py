@@ -64,7 +64,7 @@ def geodesic_distance(origin: Point, destination: Point) -> Meters:
     ellipsoid. Prefer :func:`geodesic_distance_on_ellipsoid` for accuracy-
     sensitive work or compliance with geodesy references.
     """
-    return float(_loxodrome_rs.geodesic_distance(origin._handle, destination._handle))
+    return _loxodrome_rs.geodesic_distance(origin._handle, destination._handle)
 
 
 def geodesic_distance_on_ellipsoid(
@@ -74,18 +74,16 @@ def geodesic_distance_on_ellipsoid(
 ) -> Meters:
     """Compute the ellipsoidal geodesic distance between two points in meters."""
     model = ellipsoid or Ellipsoid.wgs84()
-    return float(
-        _loxodrome_rs.geodesic_distance_on_ellipsoid(
-            origin._handle,
-            destination._handle,
-            ellipsoid=model._handle,
-        )
+    return _loxodrome_rs.geodesic_distance_on_ellipsoid(
+        origin._handle,
+        destination._handle,
+        model._handle,
     )
 
 
 def geodesic_distance_3d(origin: Point3D, destination: Point3D) -> Meters:
     """Compute straight-line (ECEF chord) distance between two 3D points in meters."""
-    return float(_loxodrome_rs.geodesic_distance_3d(origin._handle, destination._handle))
+    return _loxodrome_rs.geodesic_distance_3d(origin._handle, destination._handle)
 
 
 def geodesic_with_bearings(origin: Point, destination: Point) -> GeodesicResult:
@@ -98,9 +96,9 @@ def geodesic_with_bearings(origin: Point, destination: Point) -> GeodesicResult:
     solution = _loxodrome_rs.geodesic_with_bearings(origin._handle, destination._handle)
 
     return GeodesicResult(
-        distance_m=float(solution.distance_m),
-        initial_bearing_deg=float(solution.initial_bearing_deg),
-        final_bearing_deg=float(solution.final_bearing_deg),
+        distance_m=solution.distance_m,
+        initial_bearing_deg=solution.initial_bearing_deg,
+        final_bearing_deg=solution.final_bearing_deg,
     )
 
 
@@ -114,50 +112,34 @@ def geodesic_with_bearings_on_ellipsoid(
     solution = _loxodrome_rs.geodesic_with_bearings_on_ellipsoid(
         origin._handle,
         destination._handle,
-        ellipsoid=model._handle,
+        model._handle,
     )
 
     return GeodesicResult(
-        distance_m=float(solution.distance_m),
-        initial_bearing_deg=float(solution.initial_bearing_deg),
-        final_bearing_deg=float(solution.final_bearing_deg),
+        distance_m=solution.distance_m,
+        initial_bearing_deg=solution.initial_bearing_deg,
+        final_bearing_deg=solution.final_bearing_deg,
     )
 
 
 def hausdorff_directed(a: Iterable[Point], b: Iterable[Point]) -> HausdorffDirectedWitness:
     """Directed Hausdorff distance and witness from set `a` to set `b`."""
     witness = _loxodrome_rs.hausdorff_directed(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        [it._handle for it in a],
+        [it._handle for it in b],
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_native(witness)
 
 
 def hausdorff(a: Iterable[Point], b: Iterable[Point]) -> HausdorffWitness:
     """Symmetric Hausdorff distance and witnesses between two point sets."""
     witness = _loxodrome_rs.hausdorff(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        [it._handle for it in a],
+        [it._handle for it in b],
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _symmetric_witness_from_native(witness)
 
 
 def hausdorff_directed_clipped(
@@ -172,11 +154,7 @@ def hausdorff_directed_clipped(
         bounding_box._handle,
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_native(witness)
 
 
 def hausdorff_clipped(a: Iterable[Point], b: Iterable[Point], bounding_box: BoundingBox) -> HausdorffWitness:
@@ -187,55 +165,27 @@ def hausdorff_clipped(a: Iterable[Point], b: Iterable[Point], bounding_box: Boun
         bounding_box._handle,
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _symmetric_witness_from_native(witness)
 
 
 def hausdorff_directed_3d(a: Iterable[Point3D], b: Iterable[Point3D]) -> HausdorffDirectedWitness:
     """Directed 3D Hausdorff witness using the ECEF chord metric."""
     witness = _loxodrome_rs.hausdorff_directed_3d(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        [it._handle for it in a],
+        [it._handle for it in b],
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_native(witness)
 
 
 def hausdorff_3d(a: Iterable[Point3D], b: Iterable[Point3D]) -> HausdorffWitness:
     """Symmetric 3D Hausdorff witness using the ECEF chord metric."""
     witness = _loxodrome_rs.hausdorff_3d(
-        a=[it._handle for it in a],
-        b=[it._handle for it in b],
+        [it._handle for it in a],
+        [it._handle for it in b],
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _symmetric_witness_from_native(witness)
 
 
 def hausdorff_directed_clipped_3d(
@@ -250,11 +200,7 @@ def hausdorff_directed_clipped_3d(
         bounding_box._handle,
     )
 
-    return HausdorffDirectedWitness(
-        distance_m=float(witness.distance_m),
-        origin_index=int(witness.origin_index),
-        candidate_index=int(witness.candidate_index),
-    )
+    return _directed_witness_from_native(witness)
 
 
 def hausdorff_clipped_3d(a: Iterable[Point3D], b: Iterable[Point3D], bounding_box: BoundingBox) -> HausdorffWitness:
@@ -265,19 +211,7 @@ def hausdorff_clipped_3d(a: Iterable[Point3D], b: Iterable[Point3D], bounding_bo
         bounding_box._handle,
     )
 
-    return HausdorffWitness(
-        distance_m=float(witness.distance_m),
-        a_to_b=HausdorffDirectedWitness(
-            distance_m=float(witness.a_to_b.distance_m),
-            origin_index=int(witness.a_to_b.origin_index),
-            candidate_index=int(witness.a_to_b.candidate_index),
-        ),
-        b_to_a=HausdorffDirectedWitness(
-            distance_m=float(witness.b_to_a.distance_m),
-            origin_index=int(witness.b_to_a.origin_index),
-            candidate_index=int(witness.b_to_a.candidate_index),
-        ),
-    )
+    return _symmetric_witness_from_native(witness)
 
 
 def hausdorff_polygon_boundary(
@@ -294,12 +228,28 @@ def hausdorff_polygon_boundary(
     polygon_a = Polygon(exterior_a, holes_a)
     polygon_b = Polygon(exterior_b, holes_b)
 
-    return float(
-        _loxodrome_rs.hausdorff_polygon_boundary(
-            polygon_a._handle,
-            polygon_b._handle,
-            max_segment_length_m,
-            max_segment_angle_deg,
-            int(sample_cap),
-        )
+    return _loxodrome_rs.hausdorff_polygon_boundary(
+        polygon_a._handle,
+        polygon_b._handle,
+        max_segment_length_m,
+        max_segment_angle_deg,
+        int(sample_cap),
+    )
+
+
+def _directed_witness_from_native(witness: _loxodrome_rs.HausdorffDirectedWitness) -> HausdorffDirectedWitness:
+    """Convert a native directed witness into the Python dataclass."""
+    return HausdorffDirectedWitness(
+        distance_m=witness.distance_m,
+        origin_index=witness.origin_index,
+        candidate_index=witness.candidate_index,
+    )
+
+
+def _symmetric_witness_from_native(witness: _loxodrome_rs.HausdorffWitness) -> HausdorffWitness:
+    """Convert a native symmetric witness into the Python dataclass."""
+    return HausdorffWitness(
+        distance_m=witness.distance_m,
+        a_to_b=_directed_witness_from_native(witness.a_to_b),
+        b_to_a=_directed_witness_from_native(witness.b_to_a),
     )
@@ -18,12 +18,19 @@ import numpy.typing as _npt
 
 from . import _loxodrome_rs
 from .errors import InvalidGeometryError
-from .geometry import Ellipsoid, Point, _coerce_point_like
+from .geometry import BoundingBox, Ellipsoid, Point, _coerce_point_like
+from .ops import (
+    HausdorffDirectedWitness,
+    HausdorffWitness,
+    _directed_witness_from_native,
+    _symmetric_witness_from_native,
+)
 from .types import Point as PointTuple
 from .types import Point3D as Point3DTuple
 
 FloatArray: TypeAlias = _npt.NDArray[_np.float64]
 IntArray: TypeAlias = _npt.NDArray[_np.int64]
+OffsetArray: TypeAlias = _npt.NDArray[_np.int32] | IntArray
 
 _LAT_MIN = -90.0
 _LAT_MAX = 90.0
@@ -32,7 +39,8 @@ _LON_MAX = 180.0
 
 ArrayLike: TypeAlias = Sequence[SupportsFloat] | Sequence[Sequence[SupportsFloat]] | FloatArray
 FloatBuffer: TypeAlias = FloatArray | list[float]
-IntBuffer: TypeAlias = IntArray | list[int]
+CoordBuffer: TypeAlias = FloatBuffer | _npt.NDArray[_np.float32]
+IntBuffer: TypeAlias = OffsetArray | list[int]
 CoordMatrix: TypeAlias = FloatArray | list[tuple[float, float]]
 
 
@@ -70,6 +78,12 @@ def _validate_lat_lon_numpy(lat: FloatArray, lon: FloatArray, *, context: str) -
     if lat.ndim != 1:
         raise InvalidGeometryError(f"{context}: expected 1-D lat/lon arrays, got {lat.ndim}D")
 
+    # NaN fails every comparison and +/-inf falls outside the bounds, so one fused mask covers all checks; the
+    # per-axis scans below only run to build the error message.
+    valid = (lat >= _LAT_MIN) & (lat <= _LAT_MAX) & (lon >= _LON_MIN) & (lon <= _LON_MAX)
+    if valid.all():
+        return
+
     non_finite = ~_np.isfinite(lat) | ~_np.isfinite(lon)
     if non_finite.any():
         index = int(_np.argmax(non_finite))
@@ -151,12 +165,27 @@ def _validate_offsets(offsets: Sequence[int], *, name: str, expected_final: int)
         raise InvalidGeometryError(f"{name} must end at {expected_final}, got {offsets[-1]}")
 
 
+def _validate_offsets_numpy(offsets: OffsetArray, *, name: str, expected_final: int) -> None:
+    if offsets.shape[0] == 0:
+        raise InvalidGeometryError(f"{name} must contain at least one entry")
+
+    if offsets[0] != 0:
+        raise InvalidGeometryError(f"{name} must start at 0, got {int(offsets[0])}")
+
+    if (offsets[1:] < offsets[:-1]).any():
+        raise InvalidGeometryError(f"{name} must be monotonically increasing")
+
+    if offsets[-1] != expected_final:
+        raise InvalidGeometryError(f"{name} must end at {expected_final}, got {int(offsets[-1])}")
+
+
 def _coerce_offset_array(offsets: Sequence[int], *, name: str, expected_final: int) -> tuple[IntBuffer, int]:
     if isinstance(offsets, (_np.ndarray,)):
-        offset_array = cast(IntArray, _np.ascontiguousarray(_np.asarray(offsets, dtype=_np.int64)).reshape(-1))
-        offset_list = offset_array.tolist()
-        _validate_offsets(offset_list, name=name, expected_final=expected_final)
-        return offset_array, len(offset_list)
+        # int32 offsets (the Arrow layout) are read natively by the kernels, so only widen other dtypes.
+        dtype = _np.int32 if offsets.dtype == _np.int32 else _np.int64
+        offset_array = cast(OffsetArray, _np.ascontiguousarray(offsets, dtype=dtype).reshape(-1))
+        _validate_offsets_numpy(offset_array, name=name, expected_final=expected_final)
+        return offset_array, offset_array.shape[0]
 
     offset_list = [int(value) for value in offsets]
     _validate_offsets(offset_list, name=name, expected_final=expected_final)
@@ -185,20 +214,28 @@ def _coerce_coord_matrix(coords: ArrayLike, *, dims: int) -> tuple[int, CoordMat
     return len(coord_rows), coord_rows
 
 
+def _coord_rows(coords: CoordMatrix) -> list[PointTuple]:
+    if isinstance(coords, _np.ndarray):
+        # Box each column with tolist() and zip them, instead of building one inner list per row.
+        flat = coords.reshape(-1, coords.shape[-1])
+        return cast(list[PointTuple], list(zip(*flat.T.tolist())))
+    return cast(list[PointTuple], [tuple(row) for row in coords])
+
+
 @dataclass(frozen=True, slots=True)
 class PointBatch:
     """Batch of 2D geographic points expressed in degrees."""
 
-    _lat: FloatBuffer = field(repr=False)
-    _lon: FloatBuffer = field(repr=False)
+    _lat: CoordBuffer = field(repr=False)
+    _lon: CoordBuffer = field(repr=False)
 
     @property
-    def lat_deg(self) -> FloatBuffer:
+    def lat_deg(self) -> CoordBuffer:
         """Latitude buffer in degrees."""
         return self._lat
 
     @property
-    def lon_deg(self) -> FloatBuffer:
+    def lon_deg(self) -> CoordBuffer:
         """Longitude buffer in degrees."""
         return self._lon
 
@@ -210,7 +247,7 @@ class PointBatch:
     def to_python(self) -> list[PointTuple]:
         """Return coordinates as a list of (lat, lon) tuples."""
         if isinstance(self._lat, _np.ndarray) and isinstance(self._lon, _np.ndarray):
-            return list(map(tuple, _np.stack((self._lat, self._lon), axis=-1).tolist()))
+            return list(zip(self._lat.tolist(), self._lon.tolist()))
         return list(zip(self._lat, self._lon))
 
     def __len__(self) -> int:
@@ -249,7 +286,8 @@ class Point3DBatch:
     def to_python(self) -> list[Point3DTuple]:
         """Return coordinates as a list of (lat, lon, altitude_m) tuples."""
         if isinstance(self._lat, _np.ndarray):
-            return list(map(tuple, _np.stack((self._lat, self._lon, self._alt), axis=-1).tolist()))
+            lon = _np.asarray(self._lon).tolist()
+            return list(zip(self._lat.tolist(), lon, _np.asarray(self._alt).tolist()))
         return list(zip(self._lat, self._lon, self._alt))
 
     def __len__(self) -> int:
@@ -272,11 +310,7 @@ class PolylineBatch:
 
     def to_python(self) -> tuple[list[PointTuple], list[int]]:
         """Return Python-native coordinates and offsets."""
-        coord_list = (
-            list(map(tuple, self.coords.tolist()))
-            if isinstance(self.coords, _np.ndarray)
-            else [tuple(row) for row in self.coords]
-        )
+        coord_list = _coord_rows(self.coords)
         offset_list = self.offsets.tolist() if isinstance(self.offsets, _np.ndarray) else list(self.offsets)
         return coord_list, offset_list
 
@@ -298,11 +332,7 @@ class PolygonBatch:
 
     def to_python(self) -> tuple[list[tuple[float, float]], list[int], list[int]]:
         """Return Python-native coordinates and offsets."""
-        coord_list = (
-            list(map(tuple, self.coords.tolist()))
-            if isinstance(self.coords, _np.ndarray)
-            else [tuple(row) for row in self.coords]
-        )
+        coord_list = _coord_rows(self.coords)
         ring_offsets = (
             self.ring_offsets.tolist() if isinstance(self.ring_offsets, _np.ndarray) else list(self.ring_offsets)
         )
@@ -327,7 +357,7 @@ class DistanceResult:
     def to_python(self) -> list[float]:
         """Return distances as Python floats."""
         if isinstance(self.distance_m, _np.ndarray):
-            return [float(value) for value in self.distance_m.tolist()]
+            return cast(list[float], self.distance_m.tolist())
         return list(self.distance_m)
 
 
@@ -355,9 +385,9 @@ class BearingsResult:
             and isinstance(self.final_bearing_deg, _np.ndarray)
         ):
             return (
-                [float(value) for value in self.distance_m.tolist()],
-                [float(value) for value in self.initial_bearing_deg.tolist()],
-                [float(value) for value in self.final_bearing_deg.tolist()],
+                self.distance_m.tolist(),
+                self.initial_bearing_deg.tolist(),
+                self.final_bearing_deg.tolist(),
             )
 
         return (
@@ -380,13 +410,29 @@ class AreaResult:
     def to_python(self) -> list[float]:
         """Return areas as Python floats."""
         if isinstance(self.area_m2, _np.ndarray):
-            return [float(value) for value in self.area_m2.tolist()]
+            return cast(list[float], self.area_m2.tolist())
         return list(self.area_m2)
 
 
-def points_from_coords(lat_deg: ArrayLike, lon_deg: ArrayLike | None = None) -> PointBatch:
-    """Construct a PointBatch from latitude/longitude buffers."""
+def points_from_coords(
+    lat_deg: ArrayLike,
+    lon_deg: ArrayLike | None = None,
+    *,
+    dtype: _npt.DTypeLike = _np.float64,
+) -> PointBatch:
+    """Construct a PointBatch from latitude/longitude buffers.
+
+    Pass ``dtype=numpy.float32`` to store the columns in single precision. This halves the batch's memory and the
+    bytes the kernels read; coordinates are quantized to about 1e-5 degrees (roughly a meter near +/-180), while
+    kernels still compute and return float64.
+    """
+    storage = _np.dtype(dtype)
+    if storage not in (_np.float32, _np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {storage}")
+
     lat, lon = _coerce_point_columns(lat_deg, lon_deg)
+    if storage == _np.float32:
+        return PointBatch(_np.asarray(lat, dtype=_np.float32), _np.asarray(lon, dtype=_np.float32))
     return PointBatch(lat, lon)
 
 
@@ -464,7 +510,7 @@ def geodesic_distance_batch(
         origin_batch.lon_deg,
         destination_batch.lat_deg,
         destination_batch.lon_deg,
-        ellipsoid=model._handle if model else None,
+        model._handle if model else None,
     )
 
     return DistanceResult(_np.asarray(distances, dtype=_np.float64))
@@ -490,7 +536,7 @@ def geodesic_with_bearings_batch(
         origin_batch.lon_deg,
         destination_batch.lat_deg,
         destination_batch.lon_deg,
-        ellipsoid=model._handle if model else None,
+        model._handle if model else None,
     )
 
     return BearingsResult(
@@ -516,7 +562,48 @@ def geodesic_distance_to_many(
         lon,
         destination_batch.lat_deg,
         destination_batch.lon_deg,
-        ellipsoid=model._handle if model else None,
+        model._handle if model else None,
+    )
+
+    return DistanceResult(_np.asarray(distances, dtype=_np.float64))
+
+
+def geodesic_distance_matrix(
+    a: PointBatch | ArrayLike,
+    b: PointBatch | ArrayLike,
+    *,
+    ellipsoid: Ellipsoid | Sequence[float] | None = None,
+) -> FloatArray:
+    """Compute an ``(len(a), len(b))`` matrix of distances in meters between every pair of points."""
+    batch_a = _coerce_point_batch(a)
+    batch_b = _coerce_point_batch(b)
+    model = _coerce_ellipsoid(ellipsoid)
+
+    distances = _loxodrome_rs.geodesic_distance_matrix(
+        batch_a.lat_deg,
+        batch_a.lon_deg,
+        batch_b.lat_deg,
+        batch_b.lon_deg,
+        model._handle if model else None,
+    )
+
+    return _np.asarray(distances, dtype=_np.float64).reshape(len(batch_a), len(batch_b))
+
+
+def geodesic_distance_3d_batch(origins: Point3DBatch, destinations: Point3DBatch) -> DistanceResult:
+    """Compute pairwise straight-line (ECEF chord) distances between 3D origin and destination batches."""
+    if len(origins) != len(destinations):
+        raise InvalidGeometryError(
+            f"origins and destinations must share length, got {len(origins)} and {len(destinations)}"
+        )
+
+    distances = _loxodrome_rs.geodesic_distance_3d_batch(
+        origins.lat_deg,
+        origins.lon_deg,
+        origins.altitude_m,
+        destinations.lat_deg,
+        destinations.lon_deg,
+        destinations.altitude_m,
     )
 
     return DistanceResult(_np.asarray(distances, dtype=_np.float64))
@@ -533,12 +620,50 @@ def area_batch(
         polygons.coords,
         polygons.ring_offsets,
         polygons.polygon_offsets,
-        ellipsoid=model._handle if model else None,
+        model._handle if model else None,
     )
 
     return AreaResult(_np.asarray(areas, dtype=_np.float64))
 
 
+def hausdorff_directed_batch(a: PointBatch | ArrayLike, b: PointBatch | ArrayLike) -> HausdorffDirectedWitness:
+    """Directed Hausdorff witness from batch `a` to batch `b`.
+
+    Coordinates go to the kernel as buffers, so no per-point `Point` wrappers or handle lists are built.
+    """
+    batch_a = _coerce_point_batch(a)
+    batch_b = _coerce_point_batch(b)
+    witness = _loxodrome_rs.hausdorff_directed_batch(batch_a.lat_deg, batch_a.lon_deg, batch_b.lat_deg, batch_b.lon_deg)
+    return _directed_witness_from_native(witness)
+
+
+def hausdorff_batch(a: PointBatch | ArrayLike, b: PointBatch | ArrayLike) -> HausdorffWitness:
+    """Symmetric Hausdorff witness between two point batches."""
+    batch_a = _coerce_point_batch(a)
+    batch_b = _coerce_point_batch(b)
+    witness = _loxodrome_rs.hausdorff_batch(batch_a.lat_deg, batch_a.lon_deg, batch_b.lat_deg, batch_b.lon_deg)
+    return _symmetric_witness_from_native(witness)
+
+
+def bounding_box_contains(bounding_box: BoundingBox, points: PointBatch | ArrayLike) -> _npt.NDArray[_np.bool_]:
+    """Return a mask of the points that fall inside the bounding box, edges included.
+
+    Boxes with ``min_lon > max_lon`` wrap the antimeridian, matching the scalar containment check in the Rust core.
+    """
+    batch = _coerce_point_batch(points)
+    min_lat, max_lat, min_lon, max_lon = bounding_box.to_tuple()
+    # Compare in float64 so float32 columns are not tested against rounded box edges.
+    lat = _np.asarray(batch.lat_deg, dtype=_np.float64)
+    lon = _np.asarray(batch.lon_deg, dtype=_np.float64)
+
+    mask = (lat >= min_lat) & (lat <= max_lat)
+    if min_lon > max_lon:
+        mask &= (lon >= min_lon) | (lon <= max_lon)
+    else:
+        mask &= (lon >= min_lon) & (lon <= max_lon)
+    return mask
+
+
 __all__ = [
     "PointBatch",
     "Point3DBatch",
@@ -554,5 +679,10 @@ __all__ = [
     "geodesic_distance_batch",
     "geodesic_with_bearings_batch",
     "geodesic_distance_to_many",
+    "geodesic_distance_matrix",
+    "geodesic_distance_3d_batch",
     "area_batch",
+    "hausdorff_directed_batch",
+    "hausdorff_batch",
+    "bounding_box_contains",
 ]
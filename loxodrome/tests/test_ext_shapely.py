@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import importlib
+import sys
+
 import pytest
 
 from loxodrome import BoundingBox, InvalidGeometryError, LineString, Point, Point3D
-from loxodrome.ext.shapely import from_shapely, to_shapely
+from loxodrome.ext.shapely import from_shapely, to_shapely, to_shapely_many
 
 
 def test_roundtrip_converts_between_point_types() -> None:
@@ -35,6 +38,17 @@ def test_roundtrip_converts_3d_points() -> None:
     assert restored == source_point
 
 
+def test_to_shapely_many_matches_scalar_conversion() -> None:
+    vz = pytest.importorskip("loxodrome.vectorized")
+
+    batch = vz.points_from_coords([(12.5, -45.0), (1.0, 2.0)])
+    converted = to_shapely_many(batch)
+    assert [from_shapely(point) for point in converted] == [Point(12.5, -45.0), Point(1.0, 2.0)]
+
+    batch_3d = vz.points3d_from_coords([1.0], [2.0], [3.0])
+    assert [from_shapely(point) for point in to_shapely_many(batch_3d)] == [Point3D(1.0, 2.0, 3.0)]
+
+
 def test_from_shapely_rejects_non_points() -> None:
     shapely_multipoint = pytest.importorskip("shapely.geometry").MultiPoint
 
@@ -94,3 +108,12 @@ def test_to_shapely_rejects_unknown_geometries() -> None:
 
     with pytest.raises(TypeError):
         to_shapely(Dummy())  # type: ignore[arg-type]
+
+
+def test_import_without_shapely_or_numpy_points_at_extra(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "loxodrome.ext.shapely", raising=False)
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.setitem(sys.modules, "shapely", None)
+
+    with pytest.raises(ImportError, match=r"loxodrome\[shapely\]"):
+        importlib.import_module("loxodrome.ext.shapely")
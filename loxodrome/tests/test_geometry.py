@@ -17,6 +17,11 @@ def test_point_accepts_numeric_coordinates() -> None:
     assert point.to_tuple() == (12.5, -45.0)
 
 
+def test_points_hash_consistently_with_equality() -> None:
+    assert len({Point(12.5, -45), Point(12.5, -45.0), Point(0.0, 0.0)}) == 2
+    assert {Point3D(1.0, 2.0, 3.0): "a"}[Point3D(1, 2, 3)] == "a"
+
+
 @pytest.mark.parametrize(
     ("latitude", "longitude"),
     [
@@ -53,10 +58,29 @@ def test_point_rejects_bool_inputs() -> None:
         Point(0.0, False)
 
 
+def test_point_from_arrays_matches_scalar_constructor() -> None:
+    np = pytest.importorskip("numpy")
+    lat = np.array([0.0, 45.5, -89.0])
+    lon = np.array([10.0, -120.25, 179.0])
+
+    points = Point.from_arrays(lat, lon)
+
+    assert points == [Point(0.0, 10.0), Point(45.5, -120.25), Point(-89.0, 179.0)]
+    assert all(type(point.lat) is float for point in points)
+
+
+def test_point_from_arrays_rejects_out_of_range() -> None:
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(InvalidGeometryError):
+        Point.from_arrays(np.array([0.0, 91.0]), np.array([0.0, 0.0]))
+
+
 def test_ellipsoid_accepts_axes_and_wgs84_factory() -> None:
     ellipsoid = Ellipsoid(6_378_137.0, 6_356_752.314_245)
     assert ellipsoid.to_tuple() == (6_378_137.0, 6_356_752.314_245)
     assert Ellipsoid.wgs84() == ellipsoid
+    assert Ellipsoid.wgs84() is Ellipsoid.wgs84()
 
 
 @pytest.mark.parametrize(
@@ -100,6 +124,9 @@ def test_point3d_rejects_bool_inputs() -> None:
 def test_bounding_box_accepts_ordered_coordinates() -> None:
     bbox = BoundingBox(-10.0, 10.0, -20.0, 20.0)
     assert bbox.to_tuple() == (-10.0, 10.0, -20.0, 20.0)
+    assert (bbox.min_lat, bbox.max_lat, bbox.min_lon, bbox.max_lon) == (-10.0, 10.0, -20.0, 20.0)
+    assert BoundingBox(-10, 10, -20, 20) == bbox
+    assert hash(BoundingBox(-10, 10, -20, 20)) == hash(bbox)
 
 
 def test_bounding_box_accepts_antimeridian_wrap() -> None:
@@ -143,6 +170,7 @@ def test_linestring_accepts_vertices_and_to_tuple() -> None:
     line = LineString([(0.0, 0.0), (0.0, 1.0)])
     assert len(line) == 2
     assert line.to_tuple() == [(0.0, 0.0), (0.0, 1.0)]
+    assert list(line) == [Point(0.0, 0.0), Point(0.0, 1.0)]
 
 
 def test_linestring_rejects_degenerate_after_dedup() -> None:
@@ -3,9 +3,9 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from loxodrome import InvalidGeometryError, ops
+from loxodrome import InvalidGeometryError, _loxodrome_rs, ops
 from loxodrome import vectorized as vz
-from loxodrome.geometry import Point
+from loxodrome.geometry import BoundingBox, Point, Point3D
 
 
 def test_points_from_coords_numpy_roundtrip() -> None:
@@ -15,12 +15,36 @@ def test_points_from_coords_numpy_roundtrip() -> None:
     assert batch.to_python() == [(0.0, 0.0), (1.0, 1.0)]
 
 
+def test_points_from_coords_float32_storage() -> None:
+    coords = np.array([[10.0, 20.0], [-33.9, 151.2]], dtype=np.float64)
+    batch = vz.points_from_coords(coords, dtype=np.float32)
+    assert isinstance(batch.lat_deg, np.ndarray)
+    assert batch.lat_deg.dtype == np.float32
+
+    reference = vz.points_from_coords(coords)
+    origin = vz.points_from_coords([(0.0, 0.0), (0.0, 0.0)])
+    distances = vz.geodesic_distance_batch(origin, batch).to_numpy()
+    assert distances.dtype == np.float64
+    np.testing.assert_allclose(distances, vz.geodesic_distance_batch(origin, reference).to_numpy(), rtol=1e-6)
+
+
+def test_points_from_coords_rejects_integer_dtype() -> None:
+    with pytest.raises(ValueError, match="float32 or float64"):
+        vz.points_from_coords([(0.0, 0.0)], dtype=np.int64)
+
+
 def test_points_from_coords_reports_index() -> None:
     coords = np.array([[0.0, 0.0], [95.0, 0.0]], dtype=np.float64)
     with pytest.raises(InvalidGeometryError, match="index 1"):
         vz.points_from_coords(coords)
 
 
+def test_points_from_coords_reports_non_finite_before_bounds() -> None:
+    coords = np.array([[95.0, 0.0], [0.0, np.nan]], dtype=np.float64)
+    with pytest.raises(InvalidGeometryError, match="index 1: lon must be finite"):
+        vz.points_from_coords(coords)
+
+
 def test_points_from_coords_rejects_non_sequence_rows() -> None:
     with pytest.raises(InvalidGeometryError, match="coords must be at least 2-D"):
         vz.points_from_coords([1.0, 2.0])
@@ -88,6 +112,18 @@ def test_polylines_roundtrip_numpy_and_python() -> None:
     assert batch.to_python() == ([(0.0, 0.0), (0.0, 1.0), (1.0, 1.0)], [0, len(coords)])
 
 
+def test_polylines_keep_int32_offsets() -> None:
+    coords = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0]], dtype=np.float64)
+    offsets = np.array([0, len(coords)], dtype=np.int32)
+
+    batch = vz.polylines_from_coords(coords, offsets)  # type: ignore[arg-type]
+    assert isinstance(batch.offsets, np.ndarray)
+    assert batch.offsets.dtype == np.int32
+    _, offsets_np = batch.to_numpy()
+    assert offsets_np.dtype == np.int64
+    np.testing.assert_array_equal(offsets_np, offsets)
+
+
 def test_polylines_reject_nonzero_offset_start() -> None:
     coords = [(0.0, 0.0), (1.0, 1.0)]
     with pytest.raises(InvalidGeometryError, match="must start at 0"):
@@ -121,12 +157,50 @@ def test_polygons_roundtrip_numpy_and_python() -> None:
     )
 
 
+def test_polygons_keep_int32_offsets() -> None:
+    coords = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0], [0.0, 0.0]], dtype=np.float64)
+    ring_offsets = np.array([0, len(coords)], dtype=np.int32)
+    polygon_offsets = np.array([0, 1], dtype=np.int32)
+
+    batch = vz.polygons_from_coords(coords, ring_offsets, polygon_offsets)  # type: ignore[arg-type]
+    assert isinstance(batch.ring_offsets, np.ndarray)
+    assert isinstance(batch.polygon_offsets, np.ndarray)
+    assert batch.ring_offsets.dtype == np.int32
+    assert batch.polygon_offsets.dtype == np.int32
+    _, ring_offsets_np, polygon_offsets_np = batch.to_numpy()
+    np.testing.assert_array_equal(ring_offsets_np, ring_offsets)
+    np.testing.assert_array_equal(polygon_offsets_np, polygon_offsets)
+
+
+def test_area_batch_accepts_int32_offsets() -> None:
+    coords = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0], [0.0, 0.0]], dtype=np.float64)
+    wide = vz.polygons_from_coords(
+        coords,
+        np.array([0, len(coords)], dtype=np.int64),  # type: ignore[arg-type]
+        np.array([0, 1], dtype=np.int64),  # type: ignore[arg-type]
+    )
+    narrow = vz.polygons_from_coords(
+        coords,
+        np.array([0, len(coords)], dtype=np.int32),  # type: ignore[arg-type]
+        np.array([0, 1], dtype=np.int32),  # type: ignore[arg-type]
+    )
+
+    assert vz.area_batch(narrow).to_python() == vz.area_batch(wide).to_python()
+
+
 def test_polygons_reject_non_monotonic_offsets() -> None:
     coords = [(0.0, 0.0), (1.0, 1.0)]
     with pytest.raises(InvalidGeometryError, match="monotonically increasing"):
         vz.polygons_from_coords(coords, [0, 2, 1], [0, 1])
 
 
+def test_polygons_reject_non_monotonic_numpy_offsets() -> None:
+    coords = np.array([[0.0, 0.0], [1.0, 1.0]], dtype=np.float64)
+    ring_offsets = np.array([0, 2, 1], dtype=np.int64)
+    with pytest.raises(InvalidGeometryError, match="ring_offsets must be monotonically increasing"):
+        vz.polygons_from_coords(coords, ring_offsets, [0, 1])  # type: ignore[arg-type]
+
+
 def test_geodesic_with_bearings_batch_matches_scalar() -> None:
     origins = vz.points_from_coords([(0.0, 0.0), (0.0, 0.0)])
     destinations = vz.points_from_coords([(0.0, 1.0), (1.0, 0.0)])
@@ -147,3 +221,75 @@ def test_distance_result_list_path() -> None:
     result = vz.geodesic_distance_batch(batch, batch)
     assert isinstance(result.distance_m, np.ndarray)
     assert result.to_python() == pytest.approx(result.distance_m.tolist())
+
+
+def test_bounding_box_contains_masks_points_inclusive_of_edges() -> None:
+    bbox = BoundingBox(-10.0, 10.0, -20.0, 20.0)
+    points = vz.points_from_coords([0.0, 10.0, 10.5, 0.0], [0.0, -20.0, 0.0, 21.0])
+
+    mask = vz.bounding_box_contains(bbox, points)
+
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [True, True, False, False]
+
+
+def test_bounding_box_contains_handles_antimeridian_wrap() -> None:
+    bbox = BoundingBox(-10.0, 10.0, 170.0, -170.0)
+    coords = np.array([[0.0, 175.0], [0.0, -175.0], [0.0, 0.0]])
+
+    assert vz.bounding_box_contains(bbox, coords).tolist() == [True, True, False]
+
+
+def test_hausdorff_batch_matches_point_api() -> None:
+    a = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    b = np.array([[0.0, 0.0], [0.5, 0.5]])
+    points_a = [Point(lat, lon) for lat, lon in a.tolist()]
+    points_b = [Point(lat, lon) for lat, lon in b.tolist()]
+
+    assert vz.hausdorff_directed_batch(a, b) == ops.hausdorff_directed(points_a, points_b)
+    assert vz.hausdorff_batch(vz.points_from_coords(a), b) == ops.hausdorff(points_a, points_b)
+
+
+def test_geodesic_distance_matrix_matches_pairwise_distances() -> None:
+    a = np.array([[0.0, 0.0], [10.0, 20.0]])
+    b = np.array([[0.0, 1.0], [51.5, -0.12], [-33.9, 151.2]])
+
+    matrix = vz.geodesic_distance_matrix(a, b)
+
+    assert matrix.shape == (2, 3)
+    for row, (lat1, lon1) in enumerate(a.tolist()):
+        for col, (lat2, lon2) in enumerate(b.tolist()):
+            assert matrix[row, col] == pytest.approx(ops.geodesic_distance(Point(lat1, lon1), Point(lat2, lon2)))
+
+
+def test_geodesic_distance_3d_batch_matches_point_api() -> None:
+    origins = vz.points3d_from_coords(np.array([0.0, 45.0]), np.array([0.0, 10.0]), np.array([0.0, 1000.0]))
+    destinations = vz.points3d_from_coords(np.array([0.0, 45.5]), np.array([1.0, 10.0]), np.array([500.0, 0.0]))
+
+    distances = vz.geodesic_distance_3d_batch(origins, destinations).to_python()
+
+    expected = [
+        ops.geodesic_distance_3d(Point3D(*origin), Point3D(*destination))
+        for origin, destination in zip(origins.to_python(), destinations.to_python())
+    ]
+    assert distances == pytest.approx(expected)
+
+
+def test_geodesic_distance_3d_batch_rejects_length_mismatch() -> None:
+    origins = vz.points3d_from_coords([0.0], [0.0], [0.0])
+    destinations = vz.points3d_from_coords([0.0, 1.0], [0.0, 1.0], [0.0, 0.0])
+
+    with pytest.raises(InvalidGeometryError):
+        vz.geodesic_distance_3d_batch(origins, destinations)
+
+
+def test_geodesic_distance_3d_batch_binding_rejects_non_finite_altitude() -> None:
+    with pytest.raises(InvalidGeometryError, match="index 1: altitude must be finite"):
+        _loxodrome_rs.geodesic_distance_3d_batch(
+            [0.0, 1.0], [0.0, 1.0], [0.0, float("nan")], [0.0, 1.0], [1.0, 2.0], [0.0, 0.0]
+        )
+
+
+def test_geodesic_distance_3d_batch_binding_rejects_altitude_length_mismatch() -> None:
+    with pytest.raises(ValueError, match="destinations.alt must match coordinate length"):
+        _loxodrome_rs.geodesic_distance_3d_batch([0.0], [0.0], [0.0], [1.0], [1.0], [0.0, 5.0])